@@ -48,6 +48,17 @@ class DatabaseAdapter(ABC):
         pass
 
 
+# Applied once per SQLite connection: WAL journal with NORMAL sync makes each
+# commit a single sequential append instead of rollback-journal writes + fsyncs
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA cache_size=-20000",  # ~20MB
+)
+
+
 class SQLiteAdapter(DatabaseAdapter):
     """SQLite database adapter"""
     
@@ -67,6 +78,8 @@ class SQLiteAdapter(DatabaseAdapter):
         if self.conn is None:
             self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self.conn.row_factory = sqlite3.Row  # Enable dict-like access
+            for pragma in SQLITE_PRAGMAS:
+                self.conn.execute(pragma)
             self.init_schema(self.conn)
         return self.conn
     
@@ -6,22 +6,55 @@ Phase 3: Uses outcomes_config.json for all expedition configuration.
 Phase 7: Add explainability - expose calculation breakdown.
 Systems v1: Uses config/gameplay.json as single source of truth.
 """
-import random
-import hmac
-import hashlib
 import os
-from typing import Dict, List, Any, Literal, Optional, Tuple
-from dataclasses import dataclass
+import struct
+import sys
+import time
+from collections.abc import Mapping as MappingABC
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Callable, Dict, List, Any, Literal, Mapping, NamedTuple, Optional, Sequence, Tuple
+from dataclasses import asdict, dataclass, field
 from core.models import Clone
 from core.config import CONFIG, OUTCOMES_CONFIG, OUTCOMES_CONFIG_VERSION, GAMEPLAY_CONFIG, GAMEPLAY_CONFIG_VERSION
 
 # Phase 7: Debug flag for explainability
 DEBUG_OUTCOMES = os.getenv("DEBUG_OUTCOMES", "false").lower() == "true"
 
+# Mod.source used when explain=False (labels are only read for explainability)
+_NO_SOURCE = ""
 
-@dataclass
-class SeedParts:
-    """Parts used to compute deterministic RNG seed via HMAC
+# Mod.source labels come from a small bounded set; share one interned str per label
+_FERAL_SOURCES = {band: sys.intern(f'FeralAttack:{band.upper()}') for band in ("yellow", "red")}
+
+
+@lru_cache(maxsize=64)
+def _kind_source(prefix: str, clone_kind: str, expedition_kind: str) -> str:
+    return sys.intern(f'{prefix}:{clone_kind}_on_{expedition_kind}')
+
+
+@lru_cache(maxsize=256)
+def _self_level_source(self_level: int) -> str:
+    return sys.intern(f'SELF:Level {self_level}')
+
+
+@lru_cache(maxsize=32)
+def _womb_overload_source(active_wombs_count: int) -> str:
+    return sys.intern(f'WombOverload:{active_wombs_count}_active')
+
+
+@lru_cache(maxsize=1024)
+def _womb_durability_source(womb_durability: float) -> str:
+    return sys.intern(f'Womb:Durability {womb_durability:.1f}%')
+
+
+@lru_cache(maxsize=256)
+def _practice_source(practice: str, level: int) -> str:
+    return sys.intern(f'Practice:{practice}_L{level}')
+
+
+class SeedParts(NamedTuple):
+    """Parts used to compute deterministic RNG seed via keyed BLAKE2b
     
     Systems v1: Uses self_name (normalized) instead of user_id/session_id
     """
@@ -32,13 +65,41 @@ class SeedParts:
     action_id: str  # expedition_id or task_id (for backward compat, optional)
 
 
+# womb_id and task_started_at packed as fixed-width big-endian int64 + float64
+_SEED_STRUCT = struct.Struct('>qd')
+
+
+def _pack_womb_and_time(womb_id: Any, task_started_at: Any) -> bytes:
+    """
+    Pack (womb_id, task_started_at) for the seed hash.
+    
+    womb_id comes from client-supplied state, so ids that do not fit the
+    int64/float64 layout (strings, None, out-of-range ints) fall back to
+    their text form instead of failing the request.
+    """
+    try:
+        return _SEED_STRUCT.pack(womb_id, task_started_at)
+    except struct.error:
+        return f"{womb_id}|{task_started_at}|".encode('utf-8')
+
+
+@lru_cache(maxsize=4)
+def _seed_key_bytes(key_value: Any) -> bytes:
+    """Encode the configured seed key once per distinct value"""
+    key = key_value if isinstance(key_value, bytes) else key_value.encode('utf-8')
+    if len(key) > blake2b.MAX_KEY_SIZE:
+        # BLAKE2b keys are at most 64 bytes; hash longer keys down (as HMAC does)
+        key = blake2b(key).digest()
+    return key
+
+
 def compute_rng_seed(seed_parts: SeedParts) -> int:
     """
-    HMAC-based seed: self_name|womb_id|task_started_at|config_version
+    Keyed-hash seed over self_name, womb_id, task_started_at, config_version
     
     Systems v1: Normalizes self_name (trimmed/lowered) before use.
     
-    Returns deterministic integer seed for random.Random.
+    Returns deterministic 64-bit integer seed for the outcome RNG.
     """
     # Phase 7: Hardening - validate seed parts
     if not seed_parts.self_name:
@@ -50,22 +111,21 @@ def compute_rng_seed(seed_parts: SeedParts) -> int:
     self_name_normalized = seed_parts.self_name.strip().lower()
     
     # Combine parts deterministically (order matters!)
-    seed_string = f"{self_name_normalized}|{seed_parts.womb_id}|{seed_parts.task_started_at}|{seed_parts.config_version}"
-    
-    # Use HMAC-SHA256 for a strong, deterministic seed
-    hmac_key_str = CONFIG.get("RNG_HMAC_KEY", "outcome_engine_seed")
-    if isinstance(hmac_key_str, bytes):
-        hmac_key = hmac_key_str
-    else:
-        hmac_key = hmac_key_str.encode('utf-8')
-    hashed_seed = hmac.new(hmac_key, seed_string.encode('utf-8'), hashlib.sha256).hexdigest()
+    # name bytes | packed (womb_id, task_started_at) | config_version bytes;
+    # packing avoids formatting the float timestamp as text on every call
+    seed_bytes = (
+        self_name_normalized.encode('utf-8') + b'|'
+        + _pack_womb_and_time(seed_parts.womb_id, seed_parts.task_started_at)
+        + seed_parts.config_version.encode('utf-8')
+    )
     
-    # Convert hex to int for random.Random seed (use first 16 hex chars = 64 bits)
-    return int(hashed_seed[:16], 16)
+    # Keyed BLAKE2b: a single C call producing the 64-bit digest directly
+    key_value = CONFIG.get("RNG_HMAC_KEY", "outcome_engine_seed")
+    hashed_seed = blake2b(seed_bytes, key=_seed_key_bytes(key_value), digest_size=8).digest()
+    return int.from_bytes(hashed_seed, 'big')
 
 
-@dataclass
-class Mod:
+class Mod(NamedTuple):
     """Modifier applied to a canonical stat"""
     target: Literal['time_mult', 'success_chance', 'death_chance', 'reward_mult', 'xp_mult', 'cost_mult', 'attention_delta']
     op: Literal['add', 'mult']
@@ -73,7 +133,60 @@ class Mod:
     source: str  # e.g., 'Trait:ELK', 'SELF:Level 5', 'Womb:Durability 80%'
 
 
-@dataclass
+# PCG32 (XSH-RR) constants: 64-bit LCG multiplier, default stream increment
+_PCG_MULT = 6364136223846793005
+_PCG_INC = 1442695040888963407
+_PCG_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+class _PCG32:
+    """
+    Minimal PCG32 stream for per-resolve rolls.
+    
+    A resolve makes only a handful of draws, so seeding a Mersenne Twister
+    (random.Random) dominated RNG cost. PCG32 seeds in two integer steps.
+    Seeded from compute_rng_seed(); the same seed always yields the same rolls.
+    Used by every resolver (expedition, gather, grow, upload).
+    """
+    __slots__ = ('state',)
+    
+    def __init__(self, seed: int):
+        # pcg32_srandom: step from 0, add seed, step again
+        self.state = ((_PCG_INC + seed) * _PCG_MULT + _PCG_INC) & _PCG_MASK
+    
+    def _next(self) -> int:
+        old = self.state
+        self.state = (old * _PCG_MULT + _PCG_INC) & _PCG_MASK
+        xorshifted = (((old >> 18) ^ old) >> 27) & 0xFFFFFFFF
+        rot = old >> 59
+        return ((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & 0xFFFFFFFF
+    
+    def random(self) -> float:
+        """Float in [0.0, 1.0) with 32 bits of resolution"""
+        # _next() inlined: this is the per-roll hot path
+        old = self.state
+        self.state = (old * _PCG_MULT + _PCG_INC) & _PCG_MASK
+        xorshifted = (((old >> 18) ^ old) >> 27) & 0xFFFFFFFF
+        rot = old >> 59
+        return (((xorshifted >> rot) | (xorshifted << ((-rot) & 31))) & 0xFFFFFFFF) * 2.3283064365386963e-10  # 2**-32
+    
+    def randint(self, a: int, b: int) -> int:
+        """Integer in [a, b] inclusive, unbiased (rejection sampling)"""
+        n = b - a + 1
+        if n <= 0 or n > 0x100000000:
+            raise ValueError(f"randint range [{a}, {b}] not supported")
+        threshold = (0x100000000 - n) % n
+        while True:
+            r = self._next()
+            if r >= threshold:
+                return a + r % n
+    
+    def uniform(self, a: float, b: float) -> float:
+        """Float between a and b, same formula as random.Random.uniform"""
+        return a + (b - a) * self.random()
+
+
+@dataclass(slots=True)
 class CanonicalStats:
     """All canonical stats enforced from day 1, even if not all used yet"""
     time_mult: float = 1.0
@@ -90,56 +203,75 @@ def aggregate(mods: List[Mod], base_stats: CanonicalStats) -> CanonicalStats:
     Apply all mods in order: add first, then mult.
     Single helper reused across all actions.
     """
-    stats = CanonicalStats(
-        time_mult=base_stats.time_mult,
-        success_chance=base_stats.success_chance,
-        death_chance=base_stats.death_chance,
-        reward_mult=base_stats.reward_mult,
-        xp_mult=base_stats.xp_mult,
-        cost_mult=base_stats.cost_mult,
-        attention_delta=base_stats.attention_delta
-    )
-    
-    # Separate add and mult mods by target
-    add_mods = {target: [] for target in ['time_mult', 'success_chance', 'death_chance', 'reward_mult', 'xp_mult', 'cost_mult', 'attention_delta']}
-    mult_mods = {target: [] for target in ['time_mult', 'success_chance', 'death_chance', 'reward_mult', 'xp_mult', 'cost_mult', 'attention_delta']}
+    if not mods:
+        # Nothing to apply; still return a fresh object (clamp_stats mutates)
+        return CanonicalStats(
+            time_mult=base_stats.time_mult,
+            success_chance=base_stats.success_chance,
+            death_chance=base_stats.death_chance,
+            reward_mult=base_stats.reward_mult,
+            xp_mult=base_stats.xp_mult,
+            cost_mult=base_stats.cost_mult,
+            attention_delta=base_stats.attention_delta
+        )
     
+    # Specialized for the 7 fixed targets: accumulate adds in one pass,
+    # then apply mults in a second pass (preserves per-target mod order)
+    time_mult = success_chance = death_chance = reward_mult = 0.0
+    xp_mult = cost_mult = attention_delta = 0.0
     for mod in mods:
         if mod.op == 'add':
-            add_mods[mod.target].append(mod.value)
-        elif mod.op == 'mult':
-            mult_mods[mod.target].append(mod.value)
-    
-    # Apply adds first, then mults
-    stats.time_mult += sum(add_mods['time_mult'])
-    for mult_val in mult_mods['time_mult']:
-        stats.time_mult *= mult_val
-    
-    stats.success_chance += sum(add_mods['success_chance'])
-    for mult_val in mult_mods['success_chance']:
-        stats.success_chance *= mult_val
-    
-    stats.death_chance += sum(add_mods['death_chance'])
-    for mult_val in mult_mods['death_chance']:
-        stats.death_chance *= mult_val
-    
-    stats.reward_mult += sum(add_mods['reward_mult'])
-    for mult_val in mult_mods['reward_mult']:
-        stats.reward_mult *= mult_val
+            target = mod.target
+            if target == 'death_chance':
+                death_chance += mod.value
+            elif target == 'reward_mult':
+                reward_mult += mod.value
+            elif target == 'xp_mult':
+                xp_mult += mod.value
+            elif target == 'time_mult':
+                time_mult += mod.value
+            elif target == 'cost_mult':
+                cost_mult += mod.value
+            elif target == 'success_chance':
+                success_chance += mod.value
+            elif target == 'attention_delta':
+                attention_delta += mod.value
+    
+    time_mult += base_stats.time_mult
+    success_chance += base_stats.success_chance
+    death_chance += base_stats.death_chance
+    reward_mult += base_stats.reward_mult
+    xp_mult += base_stats.xp_mult
+    cost_mult += base_stats.cost_mult
+    attention_delta += base_stats.attention_delta
     
-    stats.xp_mult += sum(add_mods['xp_mult'])
-    for mult_val in mult_mods['xp_mult']:
-        stats.xp_mult *= mult_val
-    
-    stats.cost_mult += sum(add_mods['cost_mult'])
-    for mult_val in mult_mods['cost_mult']:
-        stats.cost_mult *= mult_val
-    
-    stats.attention_delta += sum(add_mods['attention_delta'])
-    for mult_val in mult_mods['attention_delta']:
-        stats.attention_delta *= mult_val
-    
-    return stats
+    for mod in mods:
+        if mod.op == 'mult':
+            target = mod.target
+            if target == 'death_chance':
+                death_chance *= mod.value
+            elif target == 'reward_mult':
+                reward_mult *= mod.value
+            elif target == 'xp_mult':
+                xp_mult *= mod.value
+            elif target == 'time_mult':
+                time_mult *= mod.value
+            elif target == 'cost_mult':
+                cost_mult *= mod.value
+            elif target == 'success_chance':
+                success_chance *= mod.value
+            elif target == 'attention_delta':
+                attention_delta *= mod.value
+    
+    return CanonicalStats(
+        time_mult=time_mult,
+        success_chance=success_chance,
+        death_chance=death_chance,
+        reward_mult=reward_mult,
+        xp_mult=xp_mult,
+        cost_mult=cost_mult,
+        attention_delta=attention_delta
+    )
 
 
 def clamp_stats(stats: CanonicalStats) -> CanonicalStats:
@@ -149,21 +281,27 @@ def clamp_stats(stats: CanonicalStats) -> CanonicalStats:
     - time_mult ∈ [0.5, 2.0]
     - reward_mult, xp_mult, cost_mult ∈ [0.5, 3.0]
     """
+    # Inline comparisons instead of nested max()/min() builtin calls
     # Clamp multipliers
-    stats.time_mult = max(0.5, min(2.0, stats.time_mult))
-    stats.reward_mult = max(0.5, min(3.0, stats.reward_mult))
-    stats.xp_mult = max(0.5, min(3.0, stats.xp_mult))
-    stats.cost_mult = max(0.5, min(3.0, stats.cost_mult))
+    value = stats.time_mult
+    stats.time_mult = 0.5 if value < 0.5 else (2.0 if value > 2.0 else value)
+    value = stats.reward_mult
+    stats.reward_mult = 0.5 if value < 0.5 else (3.0 if value > 3.0 else value)
+    value = stats.xp_mult
+    stats.xp_mult = 0.5 if value < 0.5 else (3.0 if value > 3.0 else value)
+    value = stats.cost_mult
+    stats.cost_mult = 0.5 if value < 0.5 else (3.0 if value > 3.0 else value)
     
     # Clamp death_chance
-    stats.death_chance = max(0.0, min(1.0, stats.death_chance))
+    death = stats.death_chance
+    death = 0.0 if death < 0.0 else (1.0 if death > 1.0 else death)
+    stats.death_chance = death
     
-    # Ensure success + death ≤ 1 (death has priority)
-    if stats.success_chance + stats.death_chance > 1.0:
-        stats.success_chance = max(0.0, 1.0 - stats.death_chance)
-    
-    # Clamp success_chance
-    stats.success_chance = max(0.0, min(1.0, stats.success_chance))
+    # Ensure success + death ≤ 1 (death has priority), then clamp success_chance
+    success = stats.success_chance
+    if success + death > 1.0:
+        success = 1.0 - death  # >= 0.0 since death <= 1.0
+    stats.success_chance = 0.0 if success < 0.0 else (1.0 if success > 1.0 else success)
     
     return stats
 
@@ -173,10 +311,11 @@ class Outcome:
     """Result of outcome resolution"""
     result: Literal['success', 'death', 'failure']  # Phase 6: Grow can fail, upload always success
     stats: CanonicalStats  # Final computed stats
-    loot: Dict[str, int]  # Phase 5: For gather, contains {resource: amount}
-    xp_gained: Dict[str, int]  # Phase 5: Empty for gather (practice XP is separate)
-    mods_applied: List[Mod]  # For explainability (Phase 7)
-    terms: Dict[str, Any]  # Internal structure for Phase 7 explainability
+    # xp_gained and mods_applied default to shared empty tuples; loot and terms get fresh dicts
+    loot: Dict[str, int] = field(default_factory=dict)  # Phase 5: For gather, contains {resource: amount}
+    xp_gained: Tuple[Tuple[str, int], ...] = ()  # (kind, amount) pairs; empty for gather (practice XP is separate)
+    mods_applied: Sequence[Mod] = ()  # For explainability (Phase 7)
+    terms: Mapping[str, Any] = field(default_factory=dict)  # Internal structure for Phase 7 explainability (may be LazyTerms; use to_dict() to serialize)
     shilajit_found: bool = False
     feral_attack: Optional[Dict[str, Any]] = None  # Phase 4: Feral attack info if occurred
     time_seconds: Optional[float] = None  # Phase 5: For gather/grow, deterministic duration
@@ -185,6 +324,30 @@ class Outcome:
     soul_xp_gained: Optional[int] = None  # Phase 6: For upload, SELF XP gained
     soul_restore_percent: Optional[float] = None  # Phase 6: For upload, soul restoration
     explanation: Optional[Dict[str, Any]] = None  # Phase 7: Calculation breakdown (guarded by DEBUG_OUTCOMES)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Plain-dict view for responses and stored payloads.
+        
+        terms may be a LazyTerms mapping, which neither json nor orjson can
+        encode, so it is materialized here; mods become {target, op, value, source}.
+        """
+        return {
+            "result": self.result,
+            "stats": asdict(self.stats),
+            "loot": dict(self.loot),
+            "xp_gained": [list(pair) for pair in self.xp_gained],
+            "mods_applied": [m._asdict() for m in self.mods_applied],
+            "terms": dict(self.terms),
+            "shilajit_found": self.shilajit_found,
+            "feral_attack": self.feral_attack,
+            "time_seconds": self.time_seconds,
+            "cost": self.cost,
+            "soul_split_percent": self.soul_split_percent,
+            "soul_xp_gained": self.soul_xp_gained,
+            "soul_restore_percent": self.soul_restore_percent,
+            "explanation": self.explanation,
+        }
 
 
 @dataclass
@@ -208,9 +371,273 @@ class OutcomeContext:
     seed_parts: SeedParts = None  # For deterministic RNG
     active_wombs_count: int = 0  # Systems v1: For womb overload calculation
     prayer_bonus: Optional[Dict[str, Any]] = None  # Prayer bonus from Trinary (death_reduction, reward_mult)
+    explain: bool = True  # False skips Mod.source labels (bulk simulation); results are unchanged
+    total_xp: Optional[int] = None  # Precomputed clone.total_xp() (bulk resolves); computed when None
+
+
+@dataclass(frozen=True, slots=True)
+class _ExpeditionCompiled:
+    """Expedition config values extracted once per gameplay config version"""
+    base_death_prob: float
+    base_xp: int
+    rewards: Tuple[Tuple[str, int, int], ...]  # (resource, min, max) in config order
+    shilajit_chance: float
+    attention_gain: float
+    miner_xp_mult: float
+
+
+# Compiled config values keyed by (id(gameplay_config), config_version, name).
+# Each entry keeps a reference to its source dict so the id cannot be reused.
+_COMPILED_CACHE: Dict[Tuple[int, str, str], Tuple[Dict[str, Any], Any]] = {}
+_COMPILED_CACHE_MAX = 64
+
+
+def _compiled(gameplay_config: Dict[str, Any], name: str, build) -> Any:
+    """
+    Return build(gameplay_config), computed once per (config, version, name).
+
+    gameplay_config is immutable per config_version, so the nested dict
+    lookups only run the first time a config is seen.
+    """
+    key = (id(gameplay_config), gameplay_config.get("config_version", ""), name)
+    entry = _COMPILED_CACHE.get(key)
+    if entry is not None:
+        return entry[1]
+
+    compiled = build(gameplay_config)
+    if len(_COMPILED_CACHE) >= _COMPILED_CACHE_MAX:
+        _COMPILED_CACHE.clear()
+    _COMPILED_CACHE[key] = (gameplay_config, compiled)
+    return compiled
+
+
+def compile_expedition(gameplay_config: Dict[str, Any], expedition_kind: str) -> _ExpeditionCompiled:
+    """Return the compiled config for an expedition kind"""
+    def build(cfg: Dict[str, Any]) -> _ExpeditionCompiled:
+        expedition_config = cfg.get("expeditions", {}).get(expedition_kind, {})
+        return _ExpeditionCompiled(
+            base_death_prob=expedition_config.get("base_death_prob", 0.12),
+            base_xp=expedition_config.get("base_xp", 10),
+            rewards=tuple((res, reward_range[0], reward_range[1])
+                          for res, reward_range in expedition_config.get("rewards", {}).items()),
+            shilajit_chance=expedition_config.get("shilajit_chance", 0.15),
+            attention_gain=cfg.get("attention", {}).get("gain", {}).get("expedition", 8.0),
+            miner_xp_mult=cfg.get("xp_modifiers", {}).get("MINER_XP_MULT", 1.25),
+        )
+
+    return _compiled(gameplay_config, "expedition:" + expedition_kind, build)
+
+
+@dataclass(frozen=True, slots=True)
+class _GatherCompiled:
+    """Gather resource config values extracted once per gameplay config version"""
+    base_amount_range: List[int]  # [min, max] as in config (kept for terms)
+    base_time_range: List[int]  # [min, max] as in config (kept for terms)
+    amount_min: int
+    amount_max: int
+    time_min: int
+    time_max: int
+    attention_delta: float
+
+
+def compile_gather(gameplay_config: Dict[str, Any], resource: str) -> Optional[_GatherCompiled]:
+    """Return the compiled config for a gather resource, or None if unknown"""
+    def build(cfg: Dict[str, Any]) -> Optional[_GatherCompiled]:
+        resource_config = cfg.get("gather", {}).get("resources", {}).get(resource, {})
+        if not resource_config:
+            return None
+        base_amount_range = resource_config.get("base_amount", [1, 1])
+        base_time_range = resource_config.get("base_time", [10, 20])
+        return _GatherCompiled(
+            base_amount_range=base_amount_range,
+            base_time_range=base_time_range,
+            amount_min=base_amount_range[0],
+            amount_max=base_amount_range[1],
+            time_min=base_time_range[0],
+            time_max=base_time_range[1],
+            attention_delta=resource_config.get("attention_delta", 5.0),
+        )
+
+    return _compiled(gameplay_config, "gather:" + resource, build)
 
 
-def build_explanation(terms: Dict[str, Any], stats: CanonicalStats, mods_applied: List[Mod]) -> Dict[str, Any]:
+@dataclass(frozen=True, slots=True)
+class _GrowCompiled:
+    """Grow config values for one clone kind extracted once per gameplay config version"""
+    base_costs: Dict[str, int]
+    attention_delta: float
+    success_chance_base: float
+    soul_split_base: float
+    soul_split_variance: float
+    time_base_range: List[int]  # [min, max] as in config (kept for terms)
+    time_min: int
+    time_max: int
+    # per_level ** level for levels 0.._PRACTICE_POW_LEVELS; None when the practice is not configured
+    cognitive_time_mult_pows: Optional[Tuple[float, ...]]
+    constructive_cost_mult_pows: Optional[Tuple[float, ...]]
+
+
+# Practice levels covered by the compiled power tables (higher levels fall back to **)
+_PRACTICE_POW_LEVELS = 64
+
+
+def _pow_table(per_level: float) -> Tuple[float, ...]:
+    return tuple(per_level ** level for level in range(_PRACTICE_POW_LEVELS + 1))
+
+
+def _practice_mult(pows: Tuple[float, ...], level: int) -> float:
+    """per_level ** level, read from the compiled table when in range"""
+    return pows[level] if level <= _PRACTICE_POW_LEVELS else pows[1] ** level
+
+
+def compile_grow(gameplay_config: Dict[str, Any], clone_kind: str) -> Optional[_GrowCompiled]:
+    """Return the compiled grow config for a clone kind, or None if unknown"""
+    def build(cfg: Dict[str, Any]) -> Optional[_GrowCompiled]:
+        grow_config = cfg.get("grow", {})
+        base_costs = grow_config.get("base_costs", {}).get(clone_kind, {})
+        if not base_costs:
+            return None
+        time_base_range = grow_config.get("time_base", {}).get(clone_kind, [30, 45])
+        practices_config = cfg.get("practices", {})
+        cognitive_config = practices_config.get("Cognitive", {})
+        constructive_config = practices_config.get("Constructive", {})
+        return _GrowCompiled(
+            base_costs=base_costs,
+            attention_delta=grow_config.get("attention_delta", 5.0),
+            success_chance_base=grow_config.get("success_chance_base", 1.0),
+            soul_split_base=grow_config.get("soul_split_base", 0.08),
+            soul_split_variance=grow_config.get("soul_split_variance", 0.02),
+            time_base_range=time_base_range,
+            time_min=time_base_range[0],
+            time_max=time_base_range[1],
+            cognitive_time_mult_pows=(
+                _pow_table(cognitive_config.get("time_mult_per_level", 0.997)) if cognitive_config else None),
+            constructive_cost_mult_pows=(
+                _pow_table(constructive_config.get("cost_mult_per_level", 0.995)) if constructive_config else None),
+        )
+
+    return _compiled(gameplay_config, "grow:" + clone_kind, build)
+
+
+@dataclass(frozen=True, slots=True)
+class _UploadCompiled:
+    """Upload and upload-aging config values extracted once per gameplay config version"""
+    attention_delta: float
+    retain_range: List[float]  # [min, max] as in config (kept for terms)
+    retain_min: float
+    retain_max: float
+    soul_restore_per_100_xp: float
+    age_k: float
+    max_age_bonus: float
+
+
+def compile_upload(gameplay_config: Dict[str, Any]) -> _UploadCompiled:
+    """Return the compiled upload config"""
+    def build(cfg: Dict[str, Any]) -> _UploadCompiled:
+        upload_config = cfg.get("upload", {})
+        retain_range = upload_config.get("soul_xp_retain_range", [0.6, 0.9])
+        upload_aging = cfg.get("aging", {}).get("upload", {})
+        return _UploadCompiled(
+            attention_delta=upload_config.get("attention_delta", 0.0),
+            retain_range=retain_range,
+            retain_min=retain_range[0],
+            retain_max=retain_range[1],
+            soul_restore_per_100_xp=upload_config.get("soul_restore_per_100_xp", 0.5),
+            age_k=upload_aging.get("age_k", 0.02),
+            max_age_bonus=upload_aging.get("max_age_bonus", 4.0),
+        )
+
+    return _compiled(gameplay_config, "upload", build)
+
+
+@dataclass(frozen=True, slots=True)
+class _AttentionCompiled:
+    """Attention bands and feral attack effects extracted once per gameplay config version"""
+    thresholds: Tuple[Tuple[float, str, float], ...]  # (threshold, band, feral prob), red first
+    expedition_death_add: Dict[str, float]  # band -> death_chance add
+    gather_time_mult: float
+    gather_cost_mult: float
+    grow_time_mult: float
+    grow_cost_mult: float
+
+
+def compile_attention(gameplay_config: Dict[str, Any]) -> _AttentionCompiled:
+    """Return the compiled attention/feral attack config"""
+    def build(cfg: Dict[str, Any]) -> _AttentionCompiled:
+        attention_config = cfg.get("attention", {})
+        bands = attention_config.get("bands", {})
+        feral_attack_probs = attention_config.get("feral_attack_prob", {})
+        effects = attention_config.get("effects", {})
+        gather_effects = effects.get("gather", {})
+        grow_effects = effects.get("grow", {})
+        return _AttentionCompiled(
+            # Checked in precedence order: red wins over yellow
+            thresholds=(
+                (bands.get("red", 55), "red", feral_attack_probs.get("red", 0.0)),
+                (bands.get("yellow", 25), "yellow", feral_attack_probs.get("yellow", 0.0)),
+            ),
+            expedition_death_add=dict(effects.get("expedition", {}).get("death_add", {})),
+            gather_time_mult=gather_effects.get("time_mult", 1.0),
+            gather_cost_mult=gather_effects.get("cost_mult", 1.0),
+            grow_time_mult=grow_effects.get("time_mult", 1.0),
+            grow_cost_mult=grow_effects.get("cost_mult", 1.0),
+        )
+
+    return _compiled(gameplay_config, "attention", build)
+
+
+def attention_band_for(gameplay_config: Dict[str, Any], global_attention: float) -> Tuple[Optional[str], float]:
+    """
+    Classify global attention into a band and its feral attack probability.
+
+    Returns (None, 0.0) below the yellow threshold.
+    """
+    for threshold, band, prob in compile_attention(gameplay_config).thresholds:
+        if global_attention >= threshold:
+            return band, prob
+    return None, 0.0
+
+
+def mods_by_target(mods: Sequence[Mod]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group mods into terms entries ({source, op, value}) by target in one pass"""
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for m in mods:
+        grouped.setdefault(m.target, []).append({"source": m.source, "op": m.op, "value": m.value})
+    return grouped
+
+
+class LazyTerms(MappingABC):
+    """
+    Read-only terms mapping built on first access.
+    
+    Most resolves never read terms, so the nested {base, mods, final} dicts
+    are only materialized when a key is read, the mapping is iterated, or
+    to_dict() is called. Builder arguments are captured at construction.
+    """
+    __slots__ = ('_build', '_args', '_terms')
+    
+    def __init__(self, build: Callable[..., Dict[str, Any]], *args: Any):
+        self._build = build
+        self._args = args
+        self._terms: Optional[Dict[str, Any]] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        if self._terms is None:
+            self._terms = self._build(*self._args)
+            self._build = self._args = None
+        return self._terms
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.to_dict()[key]
+    
+    def __iter__(self):
+        return iter(self.to_dict())
+    
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+
+def build_explanation(terms: Mapping[str, Any], stats: CanonicalStats, mods_applied: List[Mod]) -> Dict[str, Any]:
     """
     Phase 7: Build explanation breakdown from terms structure.
     Returns minimal explanation: base + mods + final per target.
@@ -228,6 +655,9 @@ def build_explanation(terms: Dict[str, Any], stats: CanonicalStats, mods_applied
         'attention_delta': stats.attention_delta
     }
     
+    # Group mods by target in one pass
+    grouped_mods = mods_by_target(mods_applied)
+    
     for target, final_value in stat_targets.items():
         # Get base from terms if available, otherwise use default
         base_value = 1.0
@@ -236,13 +666,9 @@ def build_explanation(terms: Dict[str, Any], stats: CanonicalStats, mods_applied
         elif target == 'death_chance' and 'death_chance' in terms:
             base_value = terms['death_chance'].get('base', 0.12)
         
-        # Get mods for this target
-        target_mods = [{"source": m.source, "op": m.op, "value": m.value} 
-                      for m in mods_applied if m.target == target]
-        
         explanation[target] = {
             "base": base_value,
-            "mods": target_mods,
+            "mods": grouped_mods.get(target, []),
             "final": final_value
         }
     
@@ -259,28 +685,52 @@ def compute_clone_cost_multiplier(self_level: int, gameplay_config: Dict[str, An
     Compute clone cost multiplier using piecewise breakpoints.
     
     Systems v1: Piecewise cost curve with breakpoints at L4, L7, L10.
+    The result only depends on the level for a given config, so it is
+    memoized per config version.
     """
+    memo = _compiled(gameplay_config, "clone_cost_multiplier", lambda cfg: {})
+    result = memo.get(self_level)
+    if result is None:
+        if len(memo) >= _COST_MULT_MEMO_MAX:
+            memo.clear()
+        result = memo[self_level] = _clone_cost_multiplier(self_level, gameplay_config)
+    return result
+
+
+# Per-config memo size bound for compute_clone_cost_multiplier (distinct levels)
+_COST_MULT_MEMO_MAX = 1024
+
+
+def _clone_cost_multiplier(self_level: int, gameplay_config: Dict[str, Any]) -> float:
     cost_curve = gameplay_config.get("self", {}).get("clone_cost_curve", {})
     base_mult = cost_curve.get("base_mult", 1.0)
     per_level_add = cost_curve.get("per_level_add", 0.02)
     breakpoints = cost_curve.get("breakpoints", [])
     max_mult = cost_curve.get("max_mult", 1.75)
     
+    # level -> slope_mult (first breakpoint listed for a level wins)
+    slope_mults: Dict[Any, float] = {}
+    for bp in breakpoints:
+        slope_mults.setdefault(bp.get("level"), bp.get("slope_mult", 1.0))
+    
     current = base_mult
     slope = per_level_add
     
     for level in range(1, self_level + 1):
         current += slope
         # Check if we hit a breakpoint
-        for bp in breakpoints:
-            if level == bp.get("level"):
-                slope *= bp.get("slope_mult", 1.0)
-                break
+        slope_mult = slope_mults.get(level)
+        if slope_mult is not None:
+            slope *= slope_mult
     
     return min(current, max_mult)
 
 
-def trait_mods(clone: Clone, expedition_kind: str, gameplay_config: Dict[str, Any]) -> List[Mod]:
+# Per-config memo size bound for trait_mods (distinct trait sets x kinds)
+_TRAIT_MODS_MEMO_MAX = 4096
+
+
+def trait_mods(clone: Clone, expedition_kind: str, gameplay_config: Dict[str, Any], explain: bool = True) -> Sequence[Mod]:
     """
     Generate mods from clone traits.
     
@@ -288,9 +738,23 @@ def trait_mods(clone: Clone, expedition_kind: str, gameplay_config: Dict[str, An
     - Formula: (trait_value - neutral) * value_per_point
     - Applies caps per trait (death_cap, reward_cap)
     - DLT only applies to incompatible missions
+    
+    Results depend only on (traits, clone kind, expedition kind, explain) for a
+    given config, so they are memoized per config version. Returns a shared tuple.
     """
-    mods = []
     traits = clone.traits or {}
+    memo = _compiled(gameplay_config, "trait_mods", lambda cfg: {})
+    key = (tuple(traits.items()), clone.kind, expedition_kind, explain)
+    mods = memo.get(key)
+    if mods is None:
+        if len(memo) >= _TRAIT_MODS_MEMO_MAX:
+            memo.clear()
+        mods = memo[key] = tuple(_build_trait_mods(traits, clone.kind, expedition_kind, gameplay_config, explain))
+    return mods
+
+
+def _build_trait_mods(traits: Dict[str, int], clone_kind: str, expedition_kind: str, gameplay_config: Dict[str, Any], explain: bool = True) -> List[Mod]:
+    mods = []
     
     # Get traits_effects config (new structure)
     traits_effects_config = gameplay_config.get("traits_effects", {})
@@ -326,9 +790,9 @@ def trait_mods(clone: Clone, expedition_kind: str, gameplay_config: Dict[str, An
             # Special handling for DLT - only applies to incompatible missions
             if trait_code == "DLT":
                 incompatible = False
-                if expedition_kind == "MINING" and clone.kind == "VOLATILE":
+                if expedition_kind == "MINING" and clone_kind == "VOLATILE":
                     incompatible = True
-                elif expedition_kind == "COMBAT" and clone.kind == "MINER":
+                elif expedition_kind == "COMBAT" and clone_kind == "MINER":
                     incompatible = True
                 
                 if incompatible:
@@ -349,7 +813,7 @@ def trait_mods(clone: Clone, expedition_kind: str, gameplay_config: Dict[str, An
                         target='death_chance',
                         op='add',
                         value=final_value,
-                        source=f'Trait:{trait_code}({trait_value})_IncompatibleMission'
+                        source=f'Trait:{trait_code}({trait_value})_IncompatibleMission' if explain else _NO_SOURCE
                     ))
             else:
                 # Only add if non-zero (or if we want to show all traits)
@@ -358,7 +822,7 @@ def trait_mods(clone: Clone, expedition_kind: str, gameplay_config: Dict[str, An
                         target='death_chance',
                         op='add',
                         value=final_value,
-                        source=f'Trait:{trait_code}({trait_value})'
+                        source=f'Trait:{trait_code}({trait_value})' if explain else _NO_SOURCE
                     ))
         
         # Reward mult mods (for expeditions)
@@ -384,13 +848,13 @@ def trait_mods(clone: Clone, expedition_kind: str, gameplay_config: Dict[str, An
                     target='reward_mult',
                     op='add',
                     value=final_value,
-                    source=f'Trait:{trait_code}({trait_value})'
+                    source=f'Trait:{trait_code}({trait_value})' if explain else _NO_SOURCE
                 ))
     
     return mods
 
 
-def self_mods(self_level: int, practices: Dict[str, int], expedition_kind: str, clone_kind: str, gameplay_config: Dict[str, Any]) -> List[Mod]:
+def self_mods(self_level: int, practices: Dict[str, int], expedition_kind: str, clone_kind: str, gameplay_config: Dict[str, Any], explain: bool = True) -> List[Mod]:
     """
     Generate mods from SELF level and practices.
     
@@ -411,28 +875,31 @@ def self_mods(self_level: int, practices: Dict[str, int], expedition_kind: str,
         notes = clone_kind_config.get("notes", "")
         # Determine if it's a match or mismatch based on mult value
         if mult < 1.0:
-            mods.append(Mod(target='death_chance', op='mult', value=mult, source=f'KindMatch:{clone_kind}_on_{expedition_kind}'))
+            mods.append(Mod(target='death_chance', op='mult', value=mult, source=_kind_source('KindMatch', clone_kind, expedition_kind) if explain else _NO_SOURCE))
         elif mult > 1.0:
-            mods.append(Mod(target='death_chance', op='mult', value=mult, source=f'KindMismatch:{clone_kind}_on_{expedition_kind}'))
+            mods.append(Mod(target='death_chance', op='mult', value=mult, source=_kind_source('KindMismatch', clone_kind, expedition_kind) if explain else _NO_SOURCE))
     
     # Practice bonuses (will be updated in Phase 6 with new structure)
     # For now, keep old hardcoded values for backward compat
-    kinetic_level = practices.get("Kinetic", 0) // CONFIG["PRACTICE_XP_PER_LEVEL"]
-    if expedition_kind in ["MINING", "COMBAT"] and kinetic_level >= 2:
-        # Mining/combat XP multiplier (from perk_mining_xp_mult)
-        mods.append(Mod(target='xp_mult', op='mult', value=1.10, source='Practice:Kinetic_L2+'))
-    
-    cognitive_level = practices.get("Cognitive", 0) // CONFIG["PRACTICE_XP_PER_LEVEL"]
-    if expedition_kind == "EXPLORATION" and cognitive_level >= 2:
-        # Exploration yield multiplier (from perk_exploration_yield_mult)
-        mods.append(Mod(target='reward_mult', op='mult', value=1.10, source='Practice:Cognitive_L2+'))
+    # Each expedition kind reads one practice; only compute that level
+    # (CONFIG is read per call so runtime config changes still apply)
+    if expedition_kind in ("MINING", "COMBAT"):
+        kinetic_level = practices.get("Kinetic", 0) // CONFIG["PRACTICE_XP_PER_LEVEL"]
+        if kinetic_level >= 2:
+            # Mining/combat XP multiplier (from perk_mining_xp_mult)
+            mods.append(Mod(target='xp_mult', op='mult', value=1.10, source='Practice:Kinetic_L2+'))
+    elif expedition_kind == "EXPLORATION":
+        cognitive_level = practices.get("Cognitive", 0) // CONFIG["PRACTICE_XP_PER_LEVEL"]
+        if cognitive_level >= 2:
+            # Exploration yield multiplier (from perk_exploration_yield_mult)
+            mods.append(Mod(target='reward_mult', op='mult', value=1.10, source='Practice:Cognitive_L2+'))
     
     # SELF level givebacks will be added in Phase 5
     
     return mods
 
 
-def self_level_mods(self_level: int, gameplay_config: Dict[str, Any]) -> List[Mod]:
+def self_level_mods(self_level: int, gameplay_config: Dict[str, Any], explain: bool = True) -> List[Mod]:
     """
     Generate mods from SELF level givebacks.
     
@@ -455,7 +922,9 @@ def self_level_mods(self_level: int, gameplay_config: Dict[str, Any]) -> List[Mo
     
     # Calculate total bonuses
     reward_mult_add = (self_level - 1) * reward_mult_per_level
-    time_mult_cumulative = time_mult_per_level ** (self_level - 1)
+    # x ** 1 is exact, so level 2 (the most common) skips float pow
+    time_mult_cumulative = (time_mult_per_level if self_level == 2
+                            else time_mult_per_level ** (self_level - 1))
     death_add_total = (self_level - 1) * death_add_per_level
     
     # Apply caps
@@ -463,13 +932,15 @@ def self_level_mods(self_level: int, gameplay_config: Dict[str, Any]) -> List[Mo
     time_mult_final = max(time_mult_cumulative, time_mult_min)
     death_add_final = max(death_add_total, death_add_floor)
     
+    source = _self_level_source(self_level) if explain else _NO_SOURCE
+    
     # Only add mods if non-zero
     if abs(reward_mult_final) > 0.0001:
         mods.append(Mod(
             target='reward_mult',
             op='add',
             value=reward_mult_final,
-            source=f'SELF:Level {self_level}'
+            source=source
         ))
     
     if abs(time_mult_final - 1.0) > 0.0001:
@@ -477,7 +948,7 @@ def self_level_mods(self_level: int, gameplay_config: Dict[str, Any]) -> List[Mo
             target='time_mult',
             op='mult',
             value=time_mult_final,
-            source=f'SELF:Level {self_level}'
+            source=source
         ))
     
     if abs(death_add_final) > 0.0001:
@@ -485,13 +956,13 @@ def self_level_mods(self_level: int, gameplay_config: Dict[str, Any]) -> List[Mo
             target='death_chance',
             op='add',
             value=death_add_final,
-            source=f'SELF:Level {self_level}'
+            source=source
         ))
     
     return mods
 
 
-def womb_mods(womb_durability: float, gameplay_config: Dict[str, Any]) -> List[Mod]:
+def womb_mods(womb_durability: float, gameplay_config: Dict[str, Any], explain: bool = True) -> List[Mod]:
     """
     Generate mods from womb durability.
     
@@ -512,13 +983,13 @@ def womb_mods(womb_durability: float, gameplay_config: Dict[str, Any]) -> List[M
             target='time_mult',
             op='mult',
             value=time_mult_penalty,
-            source=f'Womb:Durability {womb_durability:.1f}%'
+            source=_womb_durability_source(womb_durability) if explain else _NO_SOURCE
         ))
     
     return mods
 
 
-def womb_overload_mods(active_wombs_count: int, gameplay_config: Dict[str, Any]) -> List[Mod]:
+def womb_overload_mods(active_wombs_count: int, gameplay_config: Dict[str, Any], explain: bool = True) -> List[Mod]:
     """
     Generate mods from womb overload.
     
@@ -532,6 +1003,7 @@ def womb_overload_mods(active_wombs_count: int, gameplay_config: Dict[str, Any])
     overload_config = gameplay_config.get("wombs", {}).get("overload", {})
     per_womb_attention = overload_config.get("per_active_womb_attention", 3)
     per_womb_time_mult = overload_config.get("per_active_womb_time_mult", 1.02)
+    source = _womb_overload_source(active_wombs_count) if explain else _NO_SOURCE
     
     # Attention delta (additive per womb over 1)
     attention_delta = (active_wombs_count - 1) * per_womb_attention
@@ -540,17 +1012,19 @@ def womb_overload_mods(active_wombs_count: int, gameplay_config: Dict[str, Any])
             target='attention_delta',
             op='add',
             value=attention_delta,
-            source=f'WombOverload:{active_wombs_count}_active'
+            source=source
         ))
     
     # Time multiplier (multiplicative per womb over 1)
-    time_mult = per_womb_time_mult ** (active_wombs_count - 1)
+    # x ** 1 is exact, so the common two-womb case skips float pow
+    time_mult = (per_womb_time_mult if active_wombs_count == 2
+                 else per_womb_time_mult ** (active_wombs_count - 1))
     if abs(time_mult - 1.0) > 0.0001:
         mods.append(Mod(
             target='time_mult',
             op='mult',
             value=time_mult,
-            source=f'WombOverload:{active_wombs_count}_active'
+            source=source
         ))
     
     return mods
@@ -567,6 +1041,104 @@ def attention_mods(global_attention: float) -> List[Mod]:
     return mods
 
 
+def apply_feral_attack(action: str, gameplay_config: Dict[str, Any], global_attention: float, rng: _PCG32,
+                       final_stats: CanonicalStats, mods: List[Mod]) -> Optional[Dict[str, Any]]:
+    """
+    Phase 4: Roll for a feral attack (after aggregate+clamp) and apply its penalties.
+    
+    Only rolls when attention is in the yellow or red band. On an attack the
+    per-action penalty is appended to mods and applied to final_stats in place
+    (upload attacks are a warning only and change nothing).
+    Returns the attack info for event emission, or None.
+    """
+    attention_band, attack_prob = attention_band_for(gameplay_config, global_attention)
+    if not (attack_prob > 0 and rng.random() < attack_prob):
+        return None
+    
+    if action == "upload":
+        # Warning only, no mechanical change
+        return {
+            "band": attention_band,
+            "action": action,
+            "effects": {
+                "warning": "High attention detected during upload - proceed with caution"
+            }
+        }
+    
+    attention = compile_attention(gameplay_config)
+    source = _FERAL_SOURCES.get(attention_band) or f'FeralAttack:{attention_band.upper()}'
+    
+    if action == "expedition":
+        death_add = attention.expedition_death_add.get(attention_band, 0.0)
+        if death_add > 0:
+            mods.append(Mod(target='death_chance', op='add', value=death_add, source=source))
+            # Re-apply mod to stats (just the feral mod)
+            final_stats.death_chance += death_add
+            # Re-clamp after feral attack
+            final_stats.death_chance = max(0.005, min(0.50, final_stats.death_chance))
+            # Ensure success + death ≤ 1
+            if final_stats.success_chance + final_stats.death_chance > 1.0:
+                final_stats.success_chance = max(0.0, 1.0 - final_stats.death_chance)
+        
+        return {
+            "band": attention_band,
+            "action": action,
+            "effects": {
+                "death_chance": death_add
+            }
+        }
+    
+    if action == "gather":
+        time_mult_penalty = attention.gather_time_mult
+        cost_mult_penalty = attention.gather_cost_mult
+    elif action == "grow":
+        time_mult_penalty = attention.grow_time_mult
+        cost_mult_penalty = attention.grow_cost_mult
+    else:
+        raise ValueError(f"No feral attack effects for action: {action}")
+    
+    if time_mult_penalty != 1.0:
+        mods.append(Mod(target='time_mult', op='mult', value=time_mult_penalty, source=source))
+        final_stats.time_mult *= time_mult_penalty
+    
+    if cost_mult_penalty != 1.0:
+        mods.append(Mod(target='cost_mult', op='mult', value=cost_mult_penalty, source=source))
+        final_stats.cost_mult *= cost_mult_penalty
+    
+    return {
+        "band": attention_band,
+        "action": action,
+        "effects": {
+            "time_mult": time_mult_penalty,
+            "cost_mult": cost_mult_penalty
+        }
+    }
+
+
+def _expedition_terms(mods: Sequence[Mod], base_death_prob: float, xp_reduction: float, aging_death_add: float,
+                      death_final: float, reward_final: float, xp_final: float) -> Dict[str, Any]:
+    terms_mods = mods_by_target(mods)
+    return {
+        "death_chance": {
+            "base": base_death_prob,
+            "xp_reduction": -xp_reduction,
+            "aging_risk": aging_death_add if aging_death_add > 0 else None,
+            "mods": terms_mods.get('death_chance', []),
+            "final": death_final
+        },
+        "reward_mult": {
+            "base": 1.0,
+            "mods": terms_mods.get('reward_mult', []),
+            "final": reward_final
+        },
+        "xp_mult": {
+            "base": 1.0,
+            "mods": terms_mods.get('xp_mult', []),
+            "final": xp_final
+        }
+    }
+
+
 def resolve_expedition(ctx: OutcomeContext) -> Outcome:
     """
     Resolve expedition outcome using deterministic, canonical stats system.
@@ -583,16 +1155,12 @@ def resolve_expedition(ctx: OutcomeContext) -> Outcome:
     if not ctx.seed_parts:
         raise ValueError("seed_parts required for deterministic RNG")
     
-    # 1. Compute RNG from seed_parts (HMAC recipe)
-    rng = random.Random(compute_rng_seed(ctx.seed_parts))
+    # 1. Compute RNG from seed_parts (keyed-hash recipe)
+    rng = _PCG32(compute_rng_seed(ctx.seed_parts))
     
     # 2. Compute base stats from gameplay_config (all 7 canonical stats)
-    expedition_config = ctx.gameplay_config.get("expeditions", {}).get(ctx.expedition_kind, {})
-    base_death_prob = expedition_config.get("base_death_prob", 0.12)
-    base_xp = expedition_config.get("base_xp", 10)
-    
-    # Get attention gain from config
-    attention_gain = ctx.gameplay_config.get("attention", {}).get("gain", {}).get("expedition", 8.0)
+    expedition = compile_expedition(ctx.gameplay_config, ctx.expedition_kind)
+    base_death_prob = expedition.base_death_prob
     
     base_stats = CanonicalStats(
         time_mult=1.0,  # Expeditions complete immediately, but compute anyway
@@ -601,11 +1169,11 @@ def resolve_expedition(ctx: OutcomeContext) -> Outcome:
         reward_mult=1.0,
         xp_mult=1.0,
         cost_mult=1.0,
-        attention_delta=attention_gain  # Gain attention on successful expedition
+        attention_delta=expedition.attention_gain  # Gain attention on successful expedition
     )
     
     # XP reduces death chance (each 100 XP = -2% death probability, capped at -10%)
-    total_xp = ctx.clone.total_xp()
+    total_xp = ctx.total_xp if ctx.total_xp is not None else ctx.clone.total_xp()
     xp_reduction = min(0.10, total_xp / 100.0 * 0.02)
     base_stats.death_chance -= xp_reduction
     
@@ -614,21 +1182,19 @@ def resolve_expedition(ctx: OutcomeContext) -> Outcome:
     aging_config = ctx.gameplay_config.get("aging", {})
     risk_config = aging_config.get("risk", {})
     if risk_config.get("enabled", False):
-        import time
         bio_days = ctx.clone.biological_days(current_time=time.time())
         threshold_days = risk_config.get("threshold_days", 160)
-        if bio_days > threshold_days:
-            death_add_per_day = risk_config.get("death_add_per_day", 0.00008)
-            excess_days = bio_days - threshold_days
-            aging_death_add = excess_days * death_add_per_day
-            base_stats.death_chance += aging_death_add
+        death_add_per_day = risk_config.get("death_add_per_day", 0.00008)
+        excess_days = max(0.0, bio_days - threshold_days)
+        aging_death_add = excess_days * death_add_per_day
+        base_stats.death_chance += aging_death_add
     
     # 3. Build mods list (Systems v1: reads from gameplay_config):
     mods = []
-    mods.extend(trait_mods(ctx.clone, ctx.expedition_kind, ctx.gameplay_config))
-    mods.extend(self_mods(ctx.self_level, ctx.practices, ctx.expedition_kind, ctx.clone.kind, ctx.gameplay_config))
-    mods.extend(self_level_mods(ctx.self_level, ctx.gameplay_config))  # Systems v1: SELF level givebacks
-    mods.extend(womb_mods(ctx.womb_durability, ctx.gameplay_config))
+    mods.extend(trait_mods(ctx.clone, ctx.expedition_kind, ctx.gameplay_config, ctx.explain))
+    mods.extend(self_mods(ctx.self_level, ctx.practices, ctx.expedition_kind, ctx.clone.kind, ctx.gameplay_config, ctx.explain))
+    mods.extend(self_level_mods(ctx.self_level, ctx.gameplay_config, ctx.explain))  # Systems v1: SELF level givebacks
+    mods.extend(womb_mods(ctx.womb_durability, ctx.gameplay_config, ctx.explain))
     mods.extend(attention_mods(ctx.global_attention))
     
     # Prayer bonus mods (if present)
@@ -660,53 +1226,7 @@ def resolve_expedition(ctx: OutcomeContext) -> Outcome:
     final_stats.death_chance = max(0.005, min(0.50, final_stats.death_chance))
     
     # Phase 4: Check for feral attack (after aggregate+clamp, before final roll)
-    feral_attack = None
-    attention_config = ctx.gameplay_config.get("attention", {})
-    bands = attention_config.get("bands", {})
-    yellow_threshold = bands.get("yellow", 25)
-    red_threshold = bands.get("red", 55)
-    
-    # Determine attention band
-    attention_band = None
-    if ctx.global_attention >= red_threshold:
-        attention_band = "red"
-    elif ctx.global_attention >= yellow_threshold:
-        attention_band = "yellow"
-    
-    # If in yellow or red band, roll for feral attack
-    if attention_band:
-        feral_attack_probs = attention_config.get("feral_attack_prob", {})
-        attack_prob = feral_attack_probs.get(attention_band, 0.0)
-        
-        if attack_prob > 0 and rng.random() < attack_prob:
-            # Feral attack occurred - apply per-action penalties as mods
-            action_effects = attention_config.get("effects", {}).get("expedition", {})
-            death_add = action_effects.get("death_add", {}).get(attention_band, 0.0)
-            
-            if death_add > 0:
-                feral_mod = Mod(
-                    target='death_chance',
-                    op='add',
-                    value=death_add,
-                    source=f'FeralAttack:{attention_band.upper()}'
-                )
-                mods.append(feral_mod)
-                # Re-apply mod to stats (just the feral mod)
-                final_stats.death_chance += death_add
-                # Re-clamp after feral attack
-                final_stats.death_chance = max(0.005, min(0.50, final_stats.death_chance))
-                # Ensure success + death ≤ 1
-                if final_stats.success_chance + final_stats.death_chance > 1.0:
-                    final_stats.success_chance = max(0.0, 1.0 - final_stats.death_chance)
-            
-            # Store attack info for event emission
-            feral_attack = {
-                "band": attention_band,
-                "action": "expedition",
-                "effects": {
-                    "death_chance": death_add
-                }
-            }
+    feral_attack = apply_feral_attack("expedition", ctx.gameplay_config, ctx.global_attention, rng, final_stats, mods)
     
     # 6. Roll for death/success
     roll = rng.random()
@@ -716,51 +1236,32 @@ def resolve_expedition(ctx: OutcomeContext) -> Outcome:
         result = 'success'
     
     # 7. Calculate rewards with reward_mult (from gameplay_config)
-    loot = {}
     yield_mult = final_stats.reward_mult
-    
-    rewards_config = expedition_config.get("rewards", {})
-    for res, reward_range in rewards_config.items():
-        a, b = reward_range[0], reward_range[1]  # Convert list to tuple-like
-        base_amt = rng.randint(a, b)
-        loot[res] = int(round(base_amt * yield_mult))
-    
+
+    loot = {
+        res: int(round(rng.randint(a, b) * yield_mult))
+        for res, a, b in expedition.rewards
+    } if expedition.rewards else {}
+
     # Calculate XP with xp_mult (from gameplay_config)
     # Clone kind bonus (MINER on MINING gets bonus)
-    xp_modifiers = ctx.gameplay_config.get("xp_modifiers", {})
-    base_xp_mult = xp_modifiers.get("MINER_XP_MULT", 1.25) if (ctx.expedition_kind == "MINING" and ctx.clone.kind == "MINER") else 1.0
+    base_xp_mult = expedition.miner_xp_mult if (ctx.expedition_kind == "MINING" and ctx.clone.kind == "MINER") else 1.0
     
-    gained = int(round(base_xp * base_xp_mult * final_stats.xp_mult))
-    xp_gained = {ctx.expedition_kind: gained}
+    gained = int(round(expedition.base_xp * base_xp_mult * final_stats.xp_mult))
+    xp_gained = ((ctx.expedition_kind, gained),)
     
     # Shilajit chance (from gameplay_config)
     shilajit_found = False
     if ctx.expedition_kind == "EXPLORATION":
-        shilajit_chance = expedition_config.get("shilajit_chance", 0.15)
-        if rng.random() < shilajit_chance:
+        if rng.random() < expedition.shilajit_chance:
             shilajit_found = True
             loot["Shilajit"] = loot.get("Shilajit", 0) + 1
     
-    # Build terms structure for Phase 7 explainability
-    terms = {
-        "death_chance": {
-            "base": base_death_prob,
-            "xp_reduction": -xp_reduction,
-            "aging_risk": aging_death_add if aging_death_add > 0 else None,
-            "mods": [{"source": m.source, "op": m.op, "value": m.value} for m in mods if m.target == 'death_chance'],
-            "final": final_stats.death_chance
-        },
-        "reward_mult": {
-            "base": 1.0,
-            "mods": [{"source": m.source, "op": m.op, "value": m.value} for m in mods if m.target == 'reward_mult'],
-            "final": final_stats.reward_mult
-        },
-        "xp_mult": {
-            "base": 1.0,
-            "mods": [{"source": m.source, "op": m.op, "value": m.value} for m in mods if m.target == 'xp_mult'],
-            "final": final_stats.xp_mult
-        }
-    }
+    # Build terms structure for Phase 7 explainability (materialized on first read)
+    terms = LazyTerms(
+        _expedition_terms, mods, base_death_prob, xp_reduction, aging_death_add,
+        final_stats.death_chance, final_stats.reward_mult, final_stats.xp_mult
+    )
     
     # Phase 7: Build explanation (guarded by DEBUG_OUTCOMES)
     explanation = None
@@ -780,6 +1281,28 @@ def resolve_expedition(ctx: OutcomeContext) -> Outcome:
     )
 
 
+def _gather_terms(mods: Sequence[Mod], gather: _GatherCompiled, amount: int, base_time: int,
+                  time_mult: float, final_time: float) -> Dict[str, Any]:
+    terms_mods = mods_by_target(mods)
+    return {
+        "time_mult": {
+            "base": 1.0,
+            "mods": terms_mods.get('time_mult', []),
+            "final": time_mult
+        },
+        "amount": {
+            "base_range": gather.base_amount_range,
+            "final": amount
+        },
+        "time": {
+            "base_range": gather.base_time_range,
+            "base_time": base_time,
+            "time_mult": time_mult,
+            "final": final_time
+        }
+    }
+
+
 def resolve_gather(ctx: OutcomeContext) -> Outcome:
     """
     Resolve gather resource outcome using deterministic, canonical stats system.
@@ -797,22 +1320,15 @@ def resolve_gather(ctx: OutcomeContext) -> Outcome:
     if not ctx.seed_parts:
         raise ValueError("seed_parts required for deterministic RNG")
     
-    # 1. Compute RNG from seed_parts (HMAC recipe)
-    rng = random.Random(compute_rng_seed(ctx.seed_parts))
+    # 1. Compute RNG from seed_parts (keyed-hash recipe)
+    rng = _PCG32(compute_rng_seed(ctx.seed_parts))
     
     # 2. Get resource config
-    gather_config = ctx.gameplay_config.get("gather", {})
-    resources_config = gather_config.get("resources", {})
-    resource_config = resources_config.get(ctx.resource, {})
+    gather = compile_gather(ctx.gameplay_config, ctx.resource)
     
-    if not resource_config:
+    if gather is None:
         raise ValueError(f"Unknown resource: {ctx.resource}")
     
-    # Base values from config
-    base_amount_range = resource_config.get("base_amount", [1, 1])
-    base_time_range = resource_config.get("base_time", [10, 20])
-    attention_delta = resource_config.get("attention_delta", 5.0)
-    
     # 3. Compute base stats (all 7 canonical stats)
     base_stats = CanonicalStats(
         time_mult=1.0,
@@ -821,17 +1337,17 @@ def resolve_gather(ctx: OutcomeContext) -> Outcome:
         reward_mult=1.0,
         xp_mult=1.0,
         cost_mult=1.0,
-        attention_delta=attention_delta
+        attention_delta=gather.attention_delta
     )
     
     # 4. Build mods list
     mods = []
     # SELF level givebacks
-    mods.extend(self_level_mods(ctx.self_level, ctx.gameplay_config))
+    mods.extend(self_level_mods(ctx.self_level, ctx.gameplay_config, ctx.explain))
     # Womb durability affects time (lower durability = slower)
-    mods.extend(womb_mods(ctx.womb_durability, ctx.gameplay_config))
+    mods.extend(womb_mods(ctx.womb_durability, ctx.gameplay_config, ctx.explain))
     # Womb overload (active wombs affect attention and time)
-    mods.extend(womb_overload_mods(ctx.active_wombs_count, ctx.gameplay_config))
+    mods.extend(womb_overload_mods(ctx.active_wombs_count, ctx.gameplay_config, ctx.explain))
     # Attention mods (for feral attacks)
     mods.extend(attention_mods(ctx.global_attention))
     
@@ -842,71 +1358,17 @@ def resolve_gather(ctx: OutcomeContext) -> Outcome:
     final_stats = clamp_stats(final_stats)
     
     # 7. Phase 4: Check for feral attack (after aggregate+clamp, before final calculation)
-    feral_attack = None
-    attention_config = ctx.gameplay_config.get("attention", {})
-    bands = attention_config.get("bands", {})
-    yellow_threshold = bands.get("yellow", 25)
-    red_threshold = bands.get("red", 55)
-    
-    attention_band = None
-    if ctx.global_attention >= red_threshold:
-        attention_band = "red"
-    elif ctx.global_attention >= yellow_threshold:
-        attention_band = "yellow"
-    
-    # If in yellow or red band, roll for feral attack
-    if attention_band:
-        feral_attack_probs = attention_config.get("feral_attack_prob", {})
-        attack_prob = feral_attack_probs.get(attention_band, 0.0)
-        
-        if attack_prob > 0 and rng.random() < attack_prob:
-            # Feral attack occurred - apply per-action penalties as mods
-            action_effects = attention_config.get("effects", {}).get("gather", {})
-            time_mult_penalty = action_effects.get("time_mult", 1.0)
-            cost_mult_penalty = action_effects.get("cost_mult", 1.0)
-            
-            # Apply feral effects as mods
-            if time_mult_penalty != 1.0:
-                feral_time_mod = Mod(
-                    target='time_mult',
-                    op='mult',
-                    value=time_mult_penalty,
-                    source=f'FeralAttack:{attention_band.upper()}'
-                )
-                mods.append(feral_time_mod)
-                final_stats.time_mult *= time_mult_penalty
-            
-            if cost_mult_penalty != 1.0:
-                feral_cost_mod = Mod(
-                    target='cost_mult',
-                    op='mult',
-                    value=cost_mult_penalty,
-                    source=f'FeralAttack:{attention_band.upper()}'
-                )
-                mods.append(feral_cost_mod)
-                final_stats.cost_mult *= cost_mult_penalty
-            
-            # Store attack info for event emission
-            feral_attack = {
-                "band": attention_band,
-                "action": "gather",
-                "effects": {
-                    "time_mult": time_mult_penalty,
-                    "cost_mult": cost_mult_penalty
-                }
-            }
+    feral_attack = apply_feral_attack("gather", ctx.gameplay_config, ctx.global_attention, rng, final_stats, mods)
     
     # 8. Calculate deterministic amount and time
-    amount_min, amount_max = base_amount_range[0], base_amount_range[1]
-    amount = rng.randint(amount_min, amount_max)
+    amount = rng.randint(gather.amount_min, gather.amount_max)
     
     # Special case: Shilajit always 1
     if ctx.resource == "Shilajit":
         amount = 1
     
     # Calculate deterministic time (base time * time_mult)
-    time_min, time_max = base_time_range[0], base_time_range[1]
-    base_time = rng.randint(time_min, time_max)
+    base_time = rng.randint(gather.time_min, gather.time_max)
     final_time = base_time * final_stats.time_mult
     # Clamp time to reasonable bounds
     final_time = max(1.0, min(final_time, 300.0))  # 1s to 5min
@@ -914,24 +1376,8 @@ def resolve_gather(ctx: OutcomeContext) -> Outcome:
     # 9. Build outcome
     loot = {ctx.resource: amount}
     
-    # Build terms structure for Phase 7 explainability
-    terms = {
-        "time_mult": {
-            "base": 1.0,
-            "mods": [{"source": m.source, "op": m.op, "value": m.value} for m in mods if m.target == 'time_mult'],
-            "final": final_stats.time_mult
-        },
-        "amount": {
-            "base_range": base_amount_range,
-            "final": amount
-        },
-        "time": {
-            "base_range": base_time_range,
-            "base_time": base_time,
-            "time_mult": final_stats.time_mult,
-            "final": final_time
-        }
-    }
+    # Build terms structure for Phase 7 explainability (materialized on first read)
+    terms = LazyTerms(_gather_terms, mods, gather, amount, base_time, final_stats.time_mult, final_time)
     
     # Phase 7: Build explanation (guarded by DEBUG_OUTCOMES)
     explanation = None
@@ -942,7 +1388,7 @@ def resolve_gather(ctx: OutcomeContext) -> Outcome:
         result='success',
         stats=final_stats,
         loot=loot,
-        xp_gained={},  # Practice XP is separate (awarded in handler)
+        xp_gained=(),  # Practice XP is separate (awarded in handler)
         mods_applied=mods,
         terms=terms,
         feral_attack=feral_attack,
@@ -951,6 +1397,50 @@ def resolve_gather(ctx: OutcomeContext) -> Outcome:
     )
 
 
+def _grow_cost_terms(terms_mods: Dict[str, List[Dict[str, Any]]], cost_mult_base: float, final_cost_mult: float,
+                     base_costs: Dict[str, int], cost: Dict[str, int],
+                     soul_split_base: float, soul_split_variance: float, soul_split: float) -> Dict[str, Any]:
+    """Terms shared by grow success and failure (cost and soul split)"""
+    return {
+        "cost_mult": {
+            "base": cost_mult_base,
+            "mods": terms_mods.get('cost_mult', []),
+            "final": final_cost_mult
+        },
+        "cost": {
+            "base_costs": base_costs,
+            "final": cost
+        },
+        "soul_split": {
+            "base": soul_split_base,
+            "variance": soul_split_variance,
+            "final": soul_split
+        }
+    }
+
+
+def _grow_terms(mods: Sequence[Mod], cost_mult_base: float, final_cost_mult: float,
+                base_costs: Dict[str, int], cost: Dict[str, int],
+                soul_split_base: float, soul_split_variance: float, soul_split: float,
+                time_base_range: List[int], base_time: int, time_mult: float,
+                final_time: float) -> Dict[str, Any]:
+    terms_mods = mods_by_target(mods)
+    terms = _grow_cost_terms(terms_mods, cost_mult_base, final_cost_mult, base_costs, cost,
+                             soul_split_base, soul_split_variance, soul_split)
+    terms["time_mult"] = {
+        "base": 1.0,
+        "mods": terms_mods.get('time_mult', []),
+        "final": time_mult
+    }
+    terms["time"] = {
+        "base_range": time_base_range,
+        "base_time": base_time,
+        "time_mult": time_mult,
+        "final": final_time
+    }
+    return terms
+
+
 def resolve_grow(ctx: OutcomeContext) -> Outcome:
     """
     Resolve grow clone outcome using deterministic, canonical stats system.
@@ -971,72 +1461,63 @@ def resolve_grow(ctx: OutcomeContext) -> Outcome:
     if not ctx.seed_parts:
         raise ValueError("seed_parts required for deterministic RNG")
     
-    # 1. Compute RNG from seed_parts (HMAC recipe)
-    rng = random.Random(compute_rng_seed(ctx.seed_parts))
-    
-    # 2. Get grow config
-    grow_config = ctx.gameplay_config.get("grow", {})
-    base_costs = grow_config.get("base_costs", {}).get(ctx.clone_kind, {})
+    # 1. Compute RNG from seed_parts (keyed-hash recipe)
+    rng = _PCG32(compute_rng_seed(ctx.seed_parts))
     
-    if not base_costs:
+    # 2. Get grow config (compiled once per config version)
+    grow = compile_grow(ctx.gameplay_config, ctx.clone_kind)
+    if grow is None:
         raise ValueError(f"Unknown clone kind: {ctx.clone_kind}")
+    base_costs = grow.base_costs
     
     # 3. Compute base stats (all 7 canonical stats)
-    attention_delta = grow_config.get("attention_delta", 5.0)
-    success_chance_base = grow_config.get("success_chance_base", 1.0)
-    
     base_stats = CanonicalStats(
         time_mult=1.0,
-        success_chance=success_chance_base,
+        success_chance=grow.success_chance_base,
         death_chance=0.0,  # No death chance for growing
         reward_mult=1.0,
         xp_mult=1.0,
         cost_mult=1.0,
-        attention_delta=attention_delta
+        attention_delta=grow.attention_delta
     )
     
     # 4. Build mods list
     mods = []
     # SELF level givebacks
-    mods.extend(self_level_mods(ctx.self_level, ctx.gameplay_config))
+    mods.extend(self_level_mods(ctx.self_level, ctx.gameplay_config, ctx.explain))
     # Practice mods (Systems v1)
-    practices_config = ctx.gameplay_config.get("practices", {})
     xp_per_level = ctx.config.get("PRACTICE_XP_PER_LEVEL", 100)
     
     # Cognitive: time_mult_per_level (global)
-    cognitive_config = practices_config.get("Cognitive", {})
-    if cognitive_config:
+    if grow.cognitive_time_mult_pows is not None:
         cognitive_level = ctx.practices.get("Cognitive", 0) // xp_per_level
         if cognitive_level > 0:
-            time_mult_per_level = cognitive_config.get("time_mult_per_level", 0.997)
-            time_mult_cumulative = time_mult_per_level ** cognitive_level
+            time_mult_cumulative = _practice_mult(grow.cognitive_time_mult_pows, cognitive_level)
             if abs(time_mult_cumulative - 1.0) > 0.0001:
                 mods.append(Mod(
                     target='time_mult',
                     op='mult',
                     value=time_mult_cumulative,
-                    source=f'Practice:Cognitive_L{cognitive_level}'
+                    source=_practice_source('Cognitive', cognitive_level) if ctx.explain else _NO_SOURCE
                 ))
     
     # Constructive: cost_mult_per_level (global)
-    constructive_config = practices_config.get("Constructive", {})
-    if constructive_config:
+    if grow.constructive_cost_mult_pows is not None:
         constructive_level = ctx.practices.get("Constructive", 0) // xp_per_level
         if constructive_level > 0:
-            cost_mult_per_level = constructive_config.get("cost_mult_per_level", 0.995)
-            cost_mult_cumulative = cost_mult_per_level ** constructive_level
+            cost_mult_cumulative = _practice_mult(grow.constructive_cost_mult_pows, constructive_level)
             if abs(cost_mult_cumulative - 1.0) > 0.0001:
                 mods.append(Mod(
                     target='cost_mult',
                     op='mult',
                     value=cost_mult_cumulative,
-                    source=f'Practice:Constructive_L{constructive_level}'
+                    source=_practice_source('Constructive', constructive_level) if ctx.explain else _NO_SOURCE
                 ))
     
     # Womb durability affects time (lower durability = slower)
-    mods.extend(womb_mods(ctx.womb_durability, ctx.gameplay_config))
+    mods.extend(womb_mods(ctx.womb_durability, ctx.gameplay_config, ctx.explain))
     # Womb overload (active wombs affect attention and time)
-    mods.extend(womb_overload_mods(ctx.active_wombs_count, ctx.gameplay_config))
+    mods.extend(womb_overload_mods(ctx.active_wombs_count, ctx.gameplay_config, ctx.explain))
     # Attention mods (for feral attacks)
     mods.extend(attention_mods(ctx.global_attention))
     
@@ -1047,59 +1528,7 @@ def resolve_grow(ctx: OutcomeContext) -> Outcome:
     final_stats = clamp_stats(final_stats)
     
     # 7. Phase 4: Check for feral attack (after aggregate+clamp, before final calculation)
-    feral_attack = None
-    attention_config = ctx.gameplay_config.get("attention", {})
-    bands = attention_config.get("bands", {})
-    yellow_threshold = bands.get("yellow", 25)
-    red_threshold = bands.get("red", 55)
-    
-    attention_band = None
-    if ctx.global_attention >= red_threshold:
-        attention_band = "red"
-    elif ctx.global_attention >= yellow_threshold:
-        attention_band = "yellow"
-    
-    # If in yellow or red band, roll for feral attack
-    if attention_band:
-        feral_attack_probs = attention_config.get("feral_attack_prob", {})
-        attack_prob = feral_attack_probs.get(attention_band, 0.0)
-        
-        if attack_prob > 0 and rng.random() < attack_prob:
-            # Feral attack occurred - apply per-action penalties as mods
-            action_effects = attention_config.get("effects", {}).get("grow", {})
-            time_mult_penalty = action_effects.get("time_mult", 1.0)
-            cost_mult_penalty = action_effects.get("cost_mult", 1.0)
-            
-            # Apply feral effects as mods
-            if time_mult_penalty != 1.0:
-                feral_time_mod = Mod(
-                    target='time_mult',
-                    op='mult',
-                    value=time_mult_penalty,
-                    source=f'FeralAttack:{attention_band.upper()}'
-                )
-                mods.append(feral_time_mod)
-                final_stats.time_mult *= time_mult_penalty
-            
-            if cost_mult_penalty != 1.0:
-                feral_cost_mod = Mod(
-                    target='cost_mult',
-                    op='mult',
-                    value=cost_mult_penalty,
-                    source=f'FeralAttack:{attention_band.upper()}'
-                )
-                mods.append(feral_cost_mod)
-                final_stats.cost_mult *= cost_mult_penalty
-            
-            # Store attack info for event emission
-            feral_attack = {
-                "band": attention_band,
-                "action": "grow",
-                "effects": {
-                    "time_mult": time_mult_penalty,
-                    "cost_mult": cost_mult_penalty
-                }
-            }
+    feral_attack = apply_feral_attack("grow", ctx.gameplay_config, ctx.global_attention, rng, final_stats, mods)
     
     # 8. Calculate cost with piecewise breakpoints (Systems v1)
     cost_mult_base = compute_clone_cost_multiplier(ctx.self_level, ctx.gameplay_config)
@@ -1108,13 +1537,15 @@ def resolve_grow(ctx: OutcomeContext) -> Outcome:
     final_cost_mult = cost_mult_base * final_stats.cost_mult
     
     # Calculate final cost
+    # round() of a float already returns an int; floor each resource at 1
     cost = {}
     for resource, base_amount in base_costs.items():
-        cost[resource] = max(1, int(round(base_amount * final_cost_mult)))
+        amount = round(base_amount * final_cost_mult)
+        cost[resource] = amount if amount > 1 else 1
     
     # 9. Calculate deterministic soul split
-    soul_split_base = grow_config.get("soul_split_base", 0.08)
-    soul_split_variance = grow_config.get("soul_split_variance", 0.02)
+    soul_split_base = grow.soul_split_base
+    soul_split_variance = grow.soul_split_variance
     soul_split = max(0.01, soul_split_base + rng.uniform(-soul_split_variance, soul_split_variance))
     
     # Check if sufficient soul
@@ -1122,40 +1553,22 @@ def resolve_grow(ctx: OutcomeContext) -> Outcome:
         # Phase 7: Build explanation even for failure
         explanation = None
         if DEBUG_OUTCOMES:
-            terms_failure = {
-                "cost_mult": {
-                    "base": cost_mult_base,
-                    "mods": [{"source": m.source, "op": m.op, "value": m.value} for m in mods if m.target == 'cost_mult'],
-                    "final": final_cost_mult
-                },
-                "cost": {
-                    "base_costs": base_costs,
-                    "final": cost
-                },
-                "soul_split": {
-                    "base": soul_split_base,
-                    "variance": soul_split_variance,
-                    "final": soul_split
-                }
-            }
+            terms_failure = _grow_cost_terms(mods_by_target(mods), cost_mult_base, final_cost_mult, base_costs, cost,
+                                             soul_split_base, soul_split_variance, soul_split)
             explanation = build_explanation(terms_failure, final_stats, mods)
         
         return Outcome(
             result='failure',
             stats=final_stats,
-            loot={},
-            xp_gained={},
             mods_applied=mods,
-            terms={},
             cost=cost,
             soul_split_percent=soul_split,
             explanation=explanation  # Phase 7: Calculation breakdown
         )
     
     # 10. Calculate deterministic time
-    time_base_range = grow_config.get("time_base", {}).get(ctx.clone_kind, [30, 45])
-    time_min, time_max = time_base_range[0], time_base_range[1]
-    base_time = rng.randint(time_min, time_max)
+    time_base_range = grow.time_base_range
+    base_time = rng.randint(grow.time_min, grow.time_max)
     final_time = base_time * final_stats.time_mult
     # Clamp time to reasonable bounds
     final_time = max(1.0, min(final_time, 600.0))  # 1s to 10min
@@ -1167,34 +1580,10 @@ def resolve_grow(ctx: OutcomeContext) -> Outcome:
     else:
         result = 'failure'
     
-    # Build terms structure for Phase 7 explainability
-    terms = {
-        "cost_mult": {
-            "base": cost_mult_base,
-            "mods": [{"source": m.source, "op": m.op, "value": m.value} for m in mods if m.target == 'cost_mult'],
-            "final": final_cost_mult
-        },
-        "cost": {
-            "base_costs": base_costs,
-            "final": cost
-        },
-        "soul_split": {
-            "base": soul_split_base,
-            "variance": soul_split_variance,
-            "final": soul_split
-        },
-        "time_mult": {
-            "base": 1.0,
-            "mods": [{"source": m.source, "op": m.op, "value": m.value} for m in mods if m.target == 'time_mult'],
-            "final": final_stats.time_mult
-        },
-        "time": {
-            "base_range": time_base_range,
-            "base_time": base_time,
-            "time_mult": final_stats.time_mult,
-            "final": final_time
-        }
-    }
+    # Build terms structure for Phase 7 explainability (materialized on first read)
+    terms = LazyTerms(_grow_terms, mods, cost_mult_base, final_cost_mult, base_costs, cost,
+                      soul_split_base, soul_split_variance, soul_split,
+                      time_base_range, base_time, final_stats.time_mult, final_time)
     
     # Phase 7: Build explanation (guarded by DEBUG_OUTCOMES)
     explanation = None
@@ -1204,8 +1593,6 @@ def resolve_grow(ctx: OutcomeContext) -> Outcome:
     return Outcome(
         result=result,
         stats=final_stats,
-        loot={},
-        xp_gained={},
         mods_applied=mods,
         terms=terms,
         feral_attack=feral_attack,
@@ -1235,22 +1622,19 @@ def resolve_upload(ctx: OutcomeContext) -> Outcome:
     if not ctx.seed_parts:
         raise ValueError("seed_parts required for deterministic RNG")
     
-    # 1. Compute RNG from seed_parts (HMAC recipe)
-    rng = random.Random(compute_rng_seed(ctx.seed_parts))
+    # 1. Compute RNG from seed_parts (keyed-hash recipe)
+    rng = _PCG32(compute_rng_seed(ctx.seed_parts))
     
-    # 2. Get upload config
-    upload_config = ctx.gameplay_config.get("upload", {})
+    # 2. Get upload config (compiled once per config version)
+    upload = compile_upload(ctx.gameplay_config)
     
     # 3. Calculate clone total XP
-    total_xp = sum(ctx.clone.xp.values())
+    total_xp = ctx.total_xp if ctx.total_xp is not None else ctx.clone.total_xp()
     
     # 4. Calculate biological days (for age bonus)
-    import time
     bio_days = ctx.clone.biological_days(current_time=time.time())
     
     # 5. Compute base stats (all 7 canonical stats)
-    attention_delta = upload_config.get("attention_delta", 0.0)
-    
     base_stats = CanonicalStats(
         time_mult=1.0,
         success_chance=1.0,  # Upload always succeeds
@@ -1258,13 +1642,12 @@ def resolve_upload(ctx: OutcomeContext) -> Outcome:
         reward_mult=1.0,
         xp_mult=1.0,
         cost_mult=1.0,
-        attention_delta=attention_delta
+        attention_delta=upload.attention_delta
     )
     
     # 6. Calculate SELF XP retention (deterministic)
-    retain_range = upload_config.get("soul_xp_retain_range", [0.6, 0.9])
-    retain_min, retain_max = retain_range[0], retain_range[1]
-    retain = rng.uniform(retain_min, retain_max)
+    retain_range = upload.retain_range
+    retain = rng.uniform(upload.retain_min, upload.retain_max)
     soul_xp_gained = int(total_xp * retain)
     
     # Systems v1: Survivor bonus - clones with 3+ survived runs get 20% XP bonus
@@ -1275,45 +1658,18 @@ def resolve_upload(ctx: OutcomeContext) -> Outcome:
         soul_xp_gained = int(soul_xp_gained * survivor_bonus)
     
     # 7. Calculate soul restoration (quality-based, uncapped) + age bonus
-    soul_restore_per_100_xp = upload_config.get("soul_restore_per_100_xp", 0.5)
+    soul_restore_per_100_xp = upload.soul_restore_per_100_xp
     soul_restore_percent = total_xp * soul_restore_per_100_xp / 100.0
     # Uncapped - can exceed 100%
     
     # Systems v1: Add age bonus (from aging.upload config)
-    aging_config = ctx.gameplay_config.get("aging", {})
-    upload_aging = aging_config.get("upload", {})
-    age_k = upload_aging.get("age_k", 0.02)
-    max_age_bonus = upload_aging.get("max_age_bonus", 4.0)
+    age_k = upload.age_k
+    max_age_bonus = upload.max_age_bonus
     age_bonus = min(bio_days * age_k, max_age_bonus)
     soul_restore_percent += age_bonus
     
     # 8. Phase 4: Check for feral attack (warning only, no mechanical change)
-    feral_attack = None
-    attention_config = ctx.gameplay_config.get("attention", {})
-    bands = attention_config.get("bands", {})
-    yellow_threshold = bands.get("yellow", 25)
-    red_threshold = bands.get("red", 55)
-    
-    attention_band = None
-    if ctx.global_attention >= red_threshold:
-        attention_band = "red"
-    elif ctx.global_attention >= yellow_threshold:
-        attention_band = "yellow"
-    
-    # If in yellow or red band, roll for feral attack (warning only)
-    if attention_band:
-        feral_attack_probs = attention_config.get("feral_attack_prob", {})
-        attack_prob = feral_attack_probs.get(attention_band, 0.0)
-        
-        if attack_prob > 0 and rng.random() < attack_prob:
-            # Feral attack occurred - warning only, no mechanical change
-            feral_attack = {
-                "band": attention_band,
-                "action": "upload",
-                "effects": {
-                    "warning": "High attention detected during upload - proceed with caution"
-                }
-            }
+    feral_attack = apply_feral_attack("upload", ctx.gameplay_config, ctx.global_attention, rng, base_stats, [])
     
     # Build terms structure for Phase 7 explainability
     terms = {
@@ -1346,9 +1702,6 @@ def resolve_upload(ctx: OutcomeContext) -> Outcome:
     return Outcome(
         result='success',
         stats=base_stats,  # No mods for upload
-        loot={},
-        xp_gained={},
-        mods_applied=[],
         terms=terms,
         feral_attack=feral_attack,
         soul_xp_gained=soul_xp_gained,
@@ -11,17 +11,18 @@ if str(project_root) not in sys.path:
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.datastructures import Headers
+import asyncio
 import os
 import logging
 import time
 
+import orjson
+
 from routers import leaderboard, telemetry, game, config
 from database import get_db
-from middleware.csrf import CSRFMiddleware
+from middleware.csrf import check_csrf
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -30,75 +31,159 @@ logger = logging.getLogger(__name__)
 # Environment check
 IS_PRODUCTION = os.getenv("ENVIRONMENT", "development").lower() == "production"
 
+# Production 500 body never varies; serialize it once
+INTERNAL_ERROR_BODY = b'{"detail":"Internal server error"}'
+
 # Request size limits (in bytes)
 MAX_REQUEST_SIZE = {
     "default": 10 * 1024,  # 10KB for most endpoints
     "state": 1 * 1024 * 1024,  # 1MB for state saving
 }
 
+# Per-endpoint body limits keyed by exact (method, path); everything else gets the default
+_SIZE_LIMITS = {
+    ("POST", "/api/game/state"): MAX_REQUEST_SIZE["state"],
+}
+_DEFAULT_SIZE_LIMIT = MAX_REQUEST_SIZE["default"]
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses"""
-
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-
-        # Security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-
-        # HSTS (only in production with HTTPS)
-        if IS_PRODUCTION:
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        # Content Security Policy
-        csp = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data: https:; "
-            "font-src 'self' data:; "
-            "connect-src 'self'; "
-            "frame-ancestors 'none';"
-        )
-        response.headers["Content-Security-Policy"] = csp
-
-        # Additional security headers
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-
-        return response
+# 413 bodies only depend on the limit, so encode one per distinct limit
+_TOO_LARGE_BODIES = {
+    size: orjson.dumps({"detail": f"Request body too large. Maximum size: {size} bytes"})
+    for size in set(MAX_REQUEST_SIZE.values())
+}
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    """Limit request body size to prevent DoS attacks"""
+# Security headers are identical on every response: encode them once
+_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline'; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data: https:; "
+    "font-src 'self' data:; "
+    "connect-src 'self'; "
+    "frame-ancestors 'none';"
+)
+SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"content-security-policy", _CSP.encode("latin-1")),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+]
+# HSTS (only in production with HTTPS)
+if IS_PRODUCTION:
+    SECURITY_HEADERS.append((b"strict-transport-security", b"max-age=31536000; includeSubDomains"))
+SECURITY_HEADER_NAMES = frozenset(name for name, _ in SECURITY_HEADERS)
+
+
+async def _send_json_error(send, status: int, body: bytes):
+    """Send a complete JSON error response with two raw ASGI messages"""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class SecurityStackMiddleware:
+    """
+    Request size limit, CSRF validation and security headers in one pure ASGI layer.
 
-    async def dispatch(self, request: Request, call_next):
-        # Get content length
-        content_length = request.headers.get("content-length")
+    One pass over the request headers feeds both checks, and a single send
+    wrapper adds the security headers to every response, including the 413
+    and 403 rejections sent from here. The body limit is enforced twice: up
+    front from Content-Length, then by counting bytes as the app receives
+    them, which also covers chunked bodies and understated Content-Length.
+    """
 
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+
+        # Determine size limit based on endpoint
+        max_size = _SIZE_LIMITS.get((scope["method"], path), _DEFAULT_SIZE_LIMIT)
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def send_with_headers(message):
+            nonlocal response_started
+            if rejected:
+                # A 413 already went out mid-body; drop whatever the app sends
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+                # Replace any same-named headers, then append the prebuilt list
+                message["headers"] = [
+                    header for header in message.get("headers", ())
+                    if header[0].lower() not in SECURITY_HEADER_NAMES
+                ] + SECURITY_HEADERS
+            await send(message)
+
+        async def receive_limited():
+            nonlocal received, rejected
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_size:
+                    client = scope.get("client")
+                    logger.warning(
+                        f"Request body exceeded {max_size} bytes from "
+                        f"{client[0] if client else 'unknown'} to {path}"
+                    )
+                    if not response_started:
+                        await _send_json_error(send_with_headers, 413, _TOO_LARGE_BODIES[max_size])
+                    rejected = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        content_length = None
+        cookie_header = b""
+        csrf_header = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if content_length is None:
+                    content_length = value
+            elif name == b"cookie":
+                if not cookie_header:
+                    cookie_header = value
+            elif name == b"x-csrf-token":
+                if csrf_header is None:
+                    csrf_header = value
+
+        # Limit request body size to prevent DoS attacks
         if content_length:
             content_length = int(content_length)
 
-            # Determine size limit based on endpoint
-            if "/api/game/state" in request.url.path and request.method == "POST":
-                max_size = MAX_REQUEST_SIZE["state"]
-            else:
-                max_size = MAX_REQUEST_SIZE["default"]
-
             # Check if request is too large
             if content_length > max_size:
+                client = scope.get("client")
                 logger.warning(
-                    f"Request too large: {content_length} bytes from {request.client.host} "
-                    f"to {request.url.path}"
-                )
-                return JSONResponse(
-                    status_code=413,
-                    content={"detail": f"Request body too large. Maximum size: {max_size} bytes"}
+                    f"Request too large: {content_length} bytes from {client[0] if client else 'unknown'} "
+                    f"to {path}"
                 )
+                await _send_json_error(send_with_headers, 413, _TOO_LARGE_BODIES[max_size])
+                return
 
-        return await call_next(request)
+        # CSRF protection for state-changing requests
+        csrf_error = check_csrf(scope, cookie_header, csrf_header)
+        if csrf_error is not None:
+            body = orjson.dumps({"detail": f"CSRF validation failed: {csrf_error}"})
+            await _send_json_error(send_with_headers, 403, body)
+            return
+
+        await self.app(scope, receive_limited, send_with_headers)
 
 
 # Define lifespan handler before app creation
@@ -151,7 +236,8 @@ app = FastAPI(
     title="LINEAGE API",
     description="Backend API for LINEAGE game - leaderboard, telemetry, and gameplay",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # orjson serializes route results in C
 )
 
 # CORS configuration - environment-based for security
@@ -201,9 +287,7 @@ def get_allowed_origins() -> list:
 allowed_origins = get_allowed_origins()
 
 # Add security middleware (order matters - security headers should be last in chain)
-app.add_middleware(RequestSizeLimitMiddleware)
-app.add_middleware(CSRFMiddleware)  # CSRF protection for state-changing requests
-app.add_middleware(SecurityHeadersMiddleware)
+app.add_middleware(SecurityStackMiddleware)  # Size limit, CSRF and security headers
 
 # CORS middleware
 app.add_middleware(
@@ -237,32 +321,54 @@ else:
     logger.warning(f"Frontend dist directory not found at: {frontend_dist}")
 
 
+# Root response is fully static; serialize it once
+_ROOT_BODY = orjson.dumps({
+    "service": "LINEAGE API",
+    "version": "1.0.0",
+    "status": "online"
+})
+
+# Health checks reuse the last result for this long (seconds) so a burst of
+# probes does not hit the database once per request
+HEALTH_CACHE_TTL = 1.0
+_health_cache = {"expires": 0.0, "body": b""}
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {
-        "service": "LINEAGE API",
-        "version": "1.0.0",
-        "status": "online"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint"""
+def _probe_db() -> str:
+    """Ping the database synchronously; returns the status string for /api/health"""
     try:
         # Test database connection
         from database import execute_query
         db = get_db()
         execute_query(db, "SELECT 1")
-        db_status = "connected"
+        return "connected"
     except Exception as e:
-        db_status = f"error: {str(e)}"
+        return f"error: {str(e)}"
+
+
+@app.get("/api/health")
+async def health_check():
+    """Health check endpoint (result cached for HEALTH_CACHE_TTL seconds)"""
+    now = time.monotonic()
+    if now < _health_cache["expires"]:
+        return Response(content=_health_cache["body"], media_type="application/json")
     
-    return {
+    # Run the blocking DB ping off the event loop
+    db_status = await asyncio.to_thread(_probe_db)
+
+    body = orjson.dumps({
         "status": "healthy",
         "database": db_status
-    }
+    })
+    _health_cache["expires"] = now + HEALTH_CACHE_TTL
+    _health_cache["body"] = body
+    return Response(content=body, media_type="application/json")
 
 
 # SPA fallback route - must be last to catch all non-API routes
@@ -331,13 +437,14 @@ async def global_exception_handler(request, exc):
 
     # Return sanitized error message
     if IS_PRODUCTION:
-        return JSONResponse(
+        return Response(
+            content=INTERNAL_ERROR_BODY,
             status_code=500,
-            content={"detail": "Internal server error"}
+            media_type="application/json"
         )
     else:
         # Include error details in development
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "detail": "Internal server error",
@@ -1,65 +1,81 @@
-"""CSRF protection middleware for FastAPI"""
+"""CSRF protection for state-changing requests (run from the app's security middleware)"""
 import logging
-from fastapi import Request, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+import re
+from typing import Optional
 from core.csrf import validate_csrf_token
 
 logger = logging.getLogger(__name__)
 
 # Methods that require CSRF protection
-PROTECTED_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+PROTECTED_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
 
 # Paths exempt from CSRF (e.g., login endpoints, public APIs)
 EXEMPT_PATHS = {
     "/api/telemetry",  # Telemetry can be called from anywhere
 }
 
+# Prefix match for EXEMPT_PATHS, compiled once so the per-request check runs in C
+_EXEMPT_RE = re.compile("|".join(re.escape(p) for p in sorted(EXEMPT_PATHS)))
 
-class CSRFMiddleware(BaseHTTPMiddleware):
+
+def _extract_cookies(raw: bytes, *names: bytes) -> dict[bytes, bytes]:
+    """Pull only the named cookies out of a raw Cookie header in one pass.
+
+    Like Starlette's cookie_parser, a repeated name keeps its last value.
     """
-    Middleware to enforce CSRF token validation on state-changing requests.
+    found = {}
+    for chunk in raw.split(b";"):
+        key, sep, value = chunk.partition(b"=")
+        if sep:
+            key = key.strip()
+            if key in names:
+                found[key] = value.strip()
+    return found
+
+
+def check_csrf(scope, cookie_header: bytes, header_token: Optional[bytes]) -> Optional[str]:
+    """
+    Enforce CSRF token validation on a state-changing request.
 
     CSRF tokens are required for POST/PUT/PATCH/DELETE requests to prevent
-    cross-site request forgery attacks.
+    cross-site request forgery attacks. The caller passes the raw Cookie and
+    X-CSRF-Token header values it already pulled from the scope.
+
+    Returns the validation error message, or None if the request may proceed.
     """
+    # Only check state-changing methods
+    if scope["method"] not in PROTECTED_METHODS:
+        return None
+
+    # Check if path is exempt
+    path = scope["path"]
+    if _EXEMPT_RE.match(path):
+        return None
+
+    # Get session ID from cookie
+    cookies = _extract_cookies(cookie_header, b"session_id", b"csrf_token")
+    session_id = cookies.get(b"session_id", b"").decode("latin-1")
+    if not session_id:
+        # No session = create new one, no CSRF needed yet
+        return None
+
+    # Get CSRF token from header
+    csrf_token = header_token
+
+    if not csrf_token:
+        # Also check cookie (for same-origin requests)
+        csrf_token = cookies.get(b"csrf_token")
+
+    csrf_token = csrf_token.decode("latin-1") if csrf_token else ""
+
+    # Validate CSRF token
+    is_valid, error_message = validate_csrf_token(csrf_token, session_id)
+
+    if not is_valid:
+        logger.warning(
+            f"CSRF validation failed for {scope['method']} {path}: {error_message} "
+            f"(session: {session_id[:8]}...)"
+        )
+        return error_message
 
-    async def dispatch(self, request: Request, call_next):
-        # Only check state-changing methods
-        if request.method not in PROTECTED_METHODS:
-            return await call_next(request)
-
-        # Check if path is exempt
-        path = request.url.path
-        if any(path.startswith(exempt) for exempt in EXEMPT_PATHS):
-            return await call_next(request)
-
-        # Get session ID from cookie
-        session_id = request.cookies.get("session_id")
-        if not session_id:
-            # No session = create new one, no CSRF needed yet
-            return await call_next(request)
-
-        # Get CSRF token from header
-        csrf_token = request.headers.get("X-CSRF-Token")
-
-        if not csrf_token:
-            # Also check cookie (for same-origin requests)
-            csrf_token = request.cookies.get("csrf_token")
-
-        # Validate CSRF token
-        is_valid, error_message = validate_csrf_token(csrf_token or "", session_id)
-
-        if not is_valid:
-            logger.warning(
-                f"CSRF validation failed for {request.method} {path}: {error_message} "
-                f"(session: {session_id[:8]}...)"
-            )
-            raise HTTPException(
-                status_code=403,
-                detail=f"CSRF validation failed: {error_message}"
-            )
-
-        # CSRF token is valid, proceed
-        response = await call_next(request)
-        return response
+    return None
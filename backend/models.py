@@ -1,12 +1,21 @@
 """Data models for LINEAGE backend API"""
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
-import json
+from pydantic import BaseModel, Field, constr
 import uuid
 
 
-@dataclass
+def _parse_timestamp(value):
+    """SQLite stores ISO strings; PostgreSQL already returns datetimes"""
+    if isinstance(value, str):
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class LeaderboardEntry:
     """Leaderboard entry model"""
     id: str
@@ -20,30 +29,16 @@ class LeaderboardEntry:
     
     @classmethod
     def from_row(cls, row) -> 'LeaderboardEntry':
-        """Create from database row"""
-        # Handle both dict-like rows (sqlite3.Row) and regular dicts
-        if hasattr(row, '__getitem__'):
-            get_val = lambda key: row[key] if hasattr(row, 'keys') or isinstance(row, dict) else row.__getitem__(key)
-        else:
-            get_val = lambda key: getattr(row, key, None)
-        
-        created_at = get_val('created_at')
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-        
-        updated_at = get_val('updated_at')
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-        
+        """Create from database row (sqlite3.Row or psycopg2 RealDictRow, both keyed)"""
         return cls(
-            id=str(get_val('id')),
-            self_name=str(get_val('self_name')),
-            soul_level=int(get_val('soul_level')),
-            soul_xp=int(get_val('soul_xp')),
-            clones_uploaded=int(get_val('clones_uploaded') or 0),
-            total_expeditions=int(get_val('total_expeditions') or 0),
-            created_at=created_at,
-            updated_at=updated_at
+            id=str(row['id']),
+            self_name=str(row['self_name']),
+            soul_level=int(row['soul_level']),
+            soul_xp=int(row['soul_xp']),
+            clones_uploaded=int(row['clones_uploaded'] or 0),
+            total_expeditions=int(row['total_expeditions'] or 0),
+            created_at=_parse_timestamp(row['created_at']),
+            updated_at=_parse_timestamp(row['updated_at'])
         )
     
     def to_dict(self) -> Dict[str, Any]:
@@ -60,43 +55,20 @@ class LeaderboardEntry:
         }
 
 
-@dataclass
-class LeaderboardSubmission:
-    """Leaderboard submission request model"""
-    self_name: str
-    soul_level: int
-    soul_xp: int
-    clones_uploaded: int = 0
-    total_expeditions: int = 0
-    
-    def validate(self) -> tuple[bool, Optional[str]]:
-        """Validate submission data"""
-        if not self.self_name or not self.self_name.strip():
-            return False, "self_name cannot be empty"
-        
-        if len(self.self_name) > 100:
-            return False, "self_name too long (max 100 characters)"
-        
-        if self.soul_level < 0:
-            return False, "soul_level must be non-negative"
-        
-        if self.soul_xp < 0:
-            return False, "soul_xp must be non-negative"
-        
-        if self.clones_uploaded < 0:
-            return False, "clones_uploaded must be non-negative"
-        
-        if self.total_expeditions < 0:
-            return False, "total_expeditions must be non-negative"
-        
-        return True, None
+class LeaderboardSubmission(BaseModel):
+    """Leaderboard submission request model (validated by FastAPI on parse)"""
+    self_name: constr(strip_whitespace=True, min_length=1, max_length=100)
+    soul_level: int = Field(ge=0)
+    soul_xp: int = Field(ge=0)
+    clones_uploaded: int = Field(default=0, ge=0)
+    total_expeditions: int = Field(default=0, ge=0)
     
     def to_leaderboard_entry(self) -> LeaderboardEntry:
         """Convert to LeaderboardEntry with generated ID"""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         return LeaderboardEntry(
             id=str(uuid.uuid4()),
-            self_name=self.self_name.strip(),
+            self_name=self.self_name,
             soul_level=self.soul_level,
             soul_xp=self.soul_xp,
             clones_uploaded=self.clones_uploaded,
@@ -106,7 +78,7 @@ class LeaderboardSubmission:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TelemetryEvent:
     """Telemetry event model"""
     id: str
@@ -116,14 +88,15 @@ class TelemetryEvent:
     timestamp: datetime
     
     @classmethod
-    def create(cls, session_id: str, event_type: str, data: Dict[str, Any]) -> 'TelemetryEvent':
-        """Create new telemetry event"""
+    def create(cls, session_id: str, event_type: str, data: Dict[str, Any],
+               timestamp: Optional[datetime] = None) -> 'TelemetryEvent':
+        """Create new telemetry event (timestamp defaults to now)"""
         return cls(
             id=str(uuid.uuid4()),
             session_id=session_id,
             event_type=event_type,
             data=data,
-            timestamp=datetime.utcnow()
+            timestamp=timestamp or datetime.now(timezone.utc)
         )
     
     def to_dict(self) -> Dict[str, Any]:
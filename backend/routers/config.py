@@ -4,9 +4,9 @@ Provides centralized game configuration for frontend consumption.
 Supports ETag caching to minimize bandwidth and ensure config consistency.
 """
 from fastapi import APIRouter, Request, Response
-from fastapi.responses import JSONResponse
+import gzip
 import hashlib
-import json
+import orjson
 from typing import Dict, Any
 from core.config import CONFIG, RESOURCE_TYPES
 from data.loader import load_data
@@ -21,40 +21,29 @@ def serialize_config() -> Dict[str, Any]:
     """
     Serialize game configuration for API consumption.
 
-    Converts tuples to lists for JSON compatibility and organizes config
-    into logical sections for frontend consumption.
+    Organizes config into logical sections for frontend consumption.
+    Tuples are left as-is: orjson encodes them as JSON arrays.
     """
-    # Convert tuples to lists for JSON serialization
-    def convert_tuples(obj):
-        if isinstance(obj, dict):
-            return {k: convert_tuples(v) for k, v in obj.items()}
-        elif isinstance(obj, tuple):
-            return list(obj)
-        elif isinstance(obj, list):
-            return [convert_tuples(item) for item in obj]
-        else:
-            return obj
-
     gameplay_config = {
         "version": CONFIG_VERSION,
 
         # Resource configuration
         "resources": {
             "types": RESOURCE_TYPES,
-            "gatherTime": convert_tuples(CONFIG["GATHER_TIME"]),
-            "gatherAmount": convert_tuples(CONFIG["GATHER_AMOUNT"]),
+            "gatherTime": CONFIG["GATHER_TIME"],
+            "gatherAmount": CONFIG["GATHER_AMOUNT"],
         },
 
         # Clone configuration
         "clones": {
-            "costs": convert_tuples(CONFIG["CLONE_COSTS"]),
-            "buildTime": convert_tuples(CONFIG["CLONE_TIME"]),
+            "costs": CONFIG["CLONE_COSTS"],
+            "buildTime": CONFIG["CLONE_TIME"],
         },
 
         # Assembler (Womb) configuration
         "assembler": {
             "cost": CONFIG["ASSEMBLER_COST"],
-            "buildTime": list(CONFIG["ASSEMBLER_TIME"]),
+            "buildTime": CONFIG["ASSEMBLER_TIME"],
             # Womb system configuration
             "maxDurability": CONFIG.get("WOMB_MAX_DURABILITY", 100.0),
             "maxAttention": CONFIG.get("WOMB_MAX_ATTENTION", 100.0),
@@ -78,7 +67,7 @@ def serialize_config() -> Dict[str, Any]:
 
         # Expedition configuration
         "expeditions": {
-            "rewards": convert_tuples(CONFIG["REWARDS"]),
+            "rewards": CONFIG["REWARDS"],
             "deathProbability": CONFIG["DEATH_PROB"],
             "minerXpMultiplier": CONFIG.get("MINER_XP_MULT", 1.25),
         },
@@ -88,7 +77,7 @@ def serialize_config() -> Dict[str, Any]:
             "startPercent": CONFIG["SOUL_START"],
             "splitBase": CONFIG["SOUL_SPLIT_BASE"],
             "splitVariance": CONFIG["SOUL_SPLIT_VARIANCE"],
-            "xpRetainRange": list(CONFIG["SOUL_XP_RETAIN_RANGE"]),
+            "xpRetainRange": CONFIG["SOUL_XP_RETAIN_RANGE"],
             "levelStep": CONFIG["SOUL_LEVEL_STEP"],
             "levelTraitBonus": CONFIG.get("TRAIT_BASELINE_PER_LEVEL", 1),
         },
@@ -126,18 +115,16 @@ def serialize_config() -> Dict[str, Any]:
         # Merge gameplay.json into config (overwrites existing keys)
         # This ensures all Systems v1 config is available
         gameplay_config.update(_gameplay_data)
-        # Preserve computed values (convert tuples back to lists for JSON)
-        # But allow gameplay.json to override defaults
 
     return gameplay_config
 
 
 def calculate_etag(data: Dict[str, Any]) -> str:
     """Calculate ETag for config data using SHA256 hash"""
-    # Serialize to stable JSON string (sorted keys)
-    json_str = json.dumps(data, sort_keys=True)
+    # Serialize to stable JSON bytes (sorted keys)
+    json_bytes = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
     # Calculate SHA256 hash
-    hash_obj = hashlib.sha256(json_str.encode('utf-8'))
+    hash_obj = hashlib.sha256(json_bytes)
     # Return first 16 characters of hex digest as ETag
     return f'"{hash_obj.hexdigest()[:16]}"'
 
@@ -145,6 +132,46 @@ def calculate_etag(data: Dict[str, Any]) -> str:
 # Cache serialized config and ETag (regenerated on server restart)
 _cached_config = serialize_config()
 _cached_etag = calculate_etag(_cached_config)
+# Response body encoded once; the config never changes at runtime
+_cached_config_bytes = orjson.dumps(_cached_config)
+# /version payload never changes either
+_cached_version_bytes = orjson.dumps({
+    "version": CONFIG_VERSION,
+    "etag": _cached_etag,
+})
+# Compressed once here rather than per request by a gzip middleware
+_cached_config_gzip = gzip.compress(_cached_config_bytes, compresslevel=9)
+# The gzip body is a different byte representation, so it gets its own strong ETag
+_cached_etag_gzip = f'{_cached_etag[:-1]}-gz"'
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows gzip"""
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        name, _, value = params.partition("=")
+        if name.strip().lower() != "q":
+            return True
+        try:
+            return float(value) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, per RFC 9110)"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
 
 
 @router.get("/gameplay")
@@ -165,6 +192,9 @@ async def get_gameplay_config(request: Request):
     - Server returns 304 Not Modified if unchanged
     - Client can cache config until ETag changes
 
+    The gzip and identity bodies carry different ETags; either one is
+    accepted in If-None-Match, since both validate the same config.
+
     Example:
         GET /api/config/gameplay
         If-None-Match: "abc123def456"
@@ -173,20 +203,34 @@ async def get_gameplay_config(request: Request):
         - 304 Not Modified (if ETag matches)
         - 200 OK with JSON config (if ETag changed or missing)
     """
+    use_gzip = accepts_gzip(request.headers.get("Accept-Encoding", ""))
+    headers = {
+        "ETag": _cached_etag_gzip if use_gzip else _cached_etag,
+        "Cache-Control": "public, max-age=300",  # Cache for 5 minutes
+        "Vary": "Accept-Encoding",
+    }
+
     # Check if client has cached version
     client_etag = request.headers.get("If-None-Match")
 
-    if client_etag and client_etag == _cached_etag:
-        # Config hasn't changed, return 304 Not Modified
-        return Response(status_code=304, headers={"ETag": _cached_etag})
-
-    # Return config with ETag header
-    return JSONResponse(
-        content=_cached_config,
-        headers={
-            "ETag": _cached_etag,
-            "Cache-Control": "public, max-age=300",  # Cache for 5 minutes
-        }
+    if client_etag and (etag_matches(client_etag, _cached_etag) or etag_matches(client_etag, _cached_etag_gzip)):
+        # Config hasn't changed, return 304 Not Modified (same headers as the 200)
+        return Response(status_code=304, headers=headers)
+
+    # Serve the precompressed body to clients that accept gzip
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            content=_cached_config_gzip,
+            media_type="application/json",
+            headers=headers,
+        )
+
+    # Return pre-encoded config with ETag header
+    return Response(
+        content=_cached_config_bytes,
+        media_type="application/json",
+        headers=headers,
     )
 
 
@@ -198,7 +242,4 @@ async def get_config_version():
     Returns the version string and ETag for quick version checks
     without fetching full config.
     """
-    return {
-        "version": CONFIG_VERSION,
-        "etag": _cached_etag,
-    }
+    return Response(content=_cached_version_bytes, media_type="application/json")
@@ -1,24 +1,14 @@
 """
 Game API endpoints - handles game actions and state management
 """
-import sys
-from pathlib import Path
-
-# Add project root to path (needed when running from backend/ directory)
-# This is already done in backend/main.py, but doing it here too for safety
-_backend_dir = Path(__file__).parent.parent
-_project_root = _backend_dir.parent
-if str(_project_root) not in sys.path:
-    sys.path.insert(0, str(_project_root))
-
-import json
+import orjson
 import uuid
 import time
 import logging
 import os
 from typing import Optional, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Cookie, Request, Body
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from database import get_db, DatabaseConnection, execute_query
 from game.state import GameState
 from game.rules import (
@@ -326,7 +316,7 @@ IS_PRODUCTION = os.getenv("ENVIRONMENT", "development").lower() == "production"
 _rate_limit_store: Dict[str, Dict[str, list[float]]] = {}
 
 
-def set_session_cookie(response: JSONResponse, session_id: str, cookie_name: str = "session_id"):
+def set_session_cookie(response: ORJSONResponse, session_id: str, cookie_name: str = "session_id"):
     """
     Helper to set session cookie with consistent settings.
     Simplified - just for session tracking (game state is in localStorage).
@@ -547,12 +537,16 @@ def emit_event(
     session_id: str,
     event_type: str,
     event_data: Dict[str, Any],
-    entity_id: Optional[str] = None
+    entity_id: Optional[str] = None,
+    commit: bool = True
 ) -> None:
     """
     Emit an event to the events feed.
     Events are stored in the database for the events feed endpoint.
     DB is optional - gracefully degrades if DB is unavailable.
+
+    Pass commit=False to batch several events from one request; the caller
+    must then call commit_events(db) (in a finally, so nothing is left pending).
     """
     if db is None:
         # No DB connection available - skip event emission
@@ -572,7 +566,7 @@ def emit_event(
         else:
             event_type_db = event_type
         
-        payload_json = json.dumps(event_data)
+        payload_json = orjson.dumps(event_data).decode()
         
         try:
             execute_query(db, """
@@ -586,13 +580,17 @@ def emit_event(
                 entity_id,
                 payload_json
             ))
-            db.commit()
+            if commit:
+                db.commit()
         except Exception as db_error:
-            # Rollback on error to prevent transaction cascade
-            try:
-                db.rollback()
-            except Exception:
-                pass
+            # Rollback on error to prevent transaction cascade. Batched inserts skip it:
+            # a failed statement only undoes itself, and a rollback here would also drop
+            # the events this request already queued; commit_events() handles the rest.
+            if commit:
+                try:
+                    db.rollback()
+                except Exception:
+                    pass
             # Don't break the game if event emission fails
             logger.warning(f"Failed to emit event {event_type} for session {session_id[:8]}...: {db_error}")
     except Exception as e:
@@ -669,6 +667,20 @@ def get_player_id(player_id: Optional[str] = None, session_id: Optional[str] = N
     return new_player_id
 
 
+def commit_events(db: Optional[DatabaseConnection]) -> None:
+    """Commit events emitted with commit=False (best-effort, like emit_event)"""
+    if db is None:
+        return
+    try:
+        db.commit()
+    except Exception as e:
+        try:
+            db.rollback()
+        except Exception:
+            pass
+        logger.warning(f"Failed to commit events: {e}")
+
+
 def check_and_complete_tasks(state: GameState, session_id: Optional[str] = None) -> GameState:
     """
     Check for completed tasks and auto-complete them.
@@ -684,6 +696,7 @@ def check_and_complete_tasks(state: GameState, session_id: Optional[str] = None)
     current_time = time.time()
     new_state = state.copy()
     completed_tasks = []
+    grow_events = []  # clone.grow.complete events, emitted after the loop
     
     logger.debug(f"🔍 check_and_complete_tasks: Checking {len(new_state.active_tasks)} task(s) at time {current_time:.2f}")
     
@@ -857,30 +870,31 @@ def check_and_complete_tasks(state: GameState, session_id: Optional[str] = None)
                             "created_at": clone.created_at
                         }
                         
-                        # Emit clone.grow.complete event (optional - events need DB and session_id)
+                        # Queue clone.grow.complete event (optional - events need DB and session_id)
                         if session_id:
-                            try:
-                                from database import get_db
-                                db = get_db()
-                            except:
-                                db = None
-                            
-                            if db:
-                                emit_event(db, session_id, "clone.grow.complete", {
-                                    "clone_id": clone.id,
-                                    "clone": {
-                                        "id": clone.id,
-                                        "kind": clone.kind,
-                                        "traits": clone.traits,
-                                        "xp": clone.xp,
-                                        "created_at": clone.created_at
-                                    }
-                                }, entity_id=clone.id)
+                            grow_events.append((clone.id, {
+                                "clone_id": clone.id,
+                                "clone": task_data['completed_clone']
+                            }))
             
             completed_tasks.append((task_id, task_type, task_data))
             del new_state.active_tasks[task_id]
             logger.info(f"🗑️ Removed completed task {task_id} ({task_type}) from active_tasks. Remaining: {len(new_state.active_tasks)}")
     
+    # Emit queued completion events with a single commit
+    if grow_events:
+        try:
+            from database import get_db
+            db = get_db()
+        except:
+            db = None
+        
+        if db:
+            for clone_id, event_data in grow_events:
+                emit_event(db, session_id, "clone.grow.complete", event_data,
+                           entity_id=clone_id, commit=False)
+            commit_events(db)
+    
     # Phase 1: Apply womb systems after all task completions
     # This ensures attacks can happen when tasks finish, and events are emitted through same path
     if completed_tasks:
@@ -1644,24 +1658,28 @@ async def gather_resource_endpoint(
             'attention_delta': outcome.stats.attention_delta
         }
 
-        # Phase 5: Emit feral.attack event if attack occurred during gather
-        if outcome.feral_attack and db:
-            emit_event(db, sid, "feral.attack", {
-                "band": outcome.feral_attack.get("band"),
-                "action": outcome.feral_attack.get("action"),
-                "effects": outcome.feral_attack.get("effects", {})
-            }, entity_id=gather_id)
-
-        # Apply womb systems (decay, attacks) after state change
-        from game.wombs import check_and_apply_womb_systems
-        new_state, attack_message = check_and_apply_womb_systems(new_state)
-
-        # Emit gather.start event (optional - events need DB)
-        task_data = new_state.active_tasks[task_id]
-        emit_event(db, sid, "gather.start", {
-            "resource": resource,
-            "duration": task_data.get("duration", 0)
-        }, entity_id=task_id)
+        try:
+            # Phase 5: Emit feral.attack event if attack occurred during gather
+            if outcome.feral_attack and db:
+                emit_event(db, sid, "feral.attack", {
+                    "band": outcome.feral_attack.get("band"),
+                    "action": outcome.feral_attack.get("action"),
+                    "effects": outcome.feral_attack.get("effects", {})
+                }, entity_id=gather_id, commit=False)
+
+            # Apply womb systems (decay, attacks) after state change
+            from game.wombs import check_and_apply_womb_systems
+            new_state, attack_message = check_and_apply_womb_systems(new_state)
+
+            # Emit gather.start event (optional - events need DB)
+            task_data = new_state.active_tasks[task_id]
+            emit_event(db, sid, "gather.start", {
+                "resource": resource,
+                "duration": task_data.get("duration", 0)
+            }, entity_id=task_id, commit=False)
+        finally:
+            # One commit for this request's events, even if womb systems raised
+            commit_events(db)
 
         # Don't add resources yet - they'll be added when task completes
         # State is saved to localStorage by frontend - no DB save needed
@@ -1691,7 +1709,7 @@ async def gather_resource_endpoint(
             else:
                 response_data["attack_message"] = attack_message
         
-        response = JSONResponse(content=response_data)
+        response = ORJSONResponse(content=response_data)
         set_session_cookie(response, sid, "session_id")
         return response
     except Exception as e:
@@ -1762,7 +1780,7 @@ async def build_womb_endpoint(
         if attack_message:
             response_data["attack_message"] = attack_message
         
-        response = JSONResponse(content=response_data)
+        response = ORJSONResponse(content=response_data)
         set_session_cookie(response, sid, "session_id")
         return response
     except Exception as e:
@@ -1885,7 +1903,7 @@ async def grow_clone_endpoint(
             else:
                 response_data["attack_message"] = attack_message
         
-        response = JSONResponse(content=response_data)
+        response = ORJSONResponse(content=response_data)
         set_session_cookie(response, sid, "session_id")
         return response
     except Exception as e:
@@ -1936,7 +1954,7 @@ async def apply_clone_endpoint(
         new_state, message = apply_clone(state, clone_id)
         # save_game_state(db, sid, new_state)  # DEPRECATED: State in localStorage
 
-        response = JSONResponse(content={
+        response = ORJSONResponse(content={
             "state": game_state_to_dict(new_state),
             "message": message
         })
@@ -2083,7 +2101,7 @@ async def run_expedition_endpoint(
                     float(start_ts),
                     float(end_ts),
                     "success" if clone_survived else "death",
-                    json.dumps(loot),
+                    orjson.dumps(loot).decode(),
                     xp_gained,
                     bool(clone_survived),  # Convert to boolean for database (column expects BOOLEAN, not INTEGER)
                     signature
@@ -2129,7 +2147,7 @@ async def run_expedition_endpoint(
             else:
                 response_data["attack_message"] = attack_message
         
-        response = JSONResponse(content=response_data)
+        response = ORJSONResponse(content=response_data)
         set_session_cookie(response, sid, "session_id")
         return response
     except Exception as e:
@@ -2196,28 +2214,32 @@ async def upload_clone_endpoint(
         except:
             db = None
         
-        if feral_attack_info and db:
-            upload_id = str(uuid.uuid4())
-            emit_event(db, sid, "feral.attack", {
-                "band": feral_attack_info.get("band"),
-                "action": feral_attack_info.get("action"),
-                "effects": feral_attack_info.get("effects", {})
-            }, entity_id=upload_id)
-
-        # Apply womb systems (decay, attacks) after state change
-        from game.wombs import check_and_apply_womb_systems
-        new_state, attack_message = check_and_apply_womb_systems(new_state)
-        
-        # Optional: Emit upload.complete event if DB available
-        soul_xp_delta = new_state.soul_xp - old_soul_xp
-        soul_percent_delta = new_state.soul_percent - old_soul_percent
-        
-        if db:
-            emit_event(db, sid, "upload.complete", {
-                "clone_id": clone_id,
-                "soul_xp_delta": soul_xp_delta,
-                "soul_percent_delta": soul_percent_delta,
-            }, entity_id=clone_id)
+        try:
+            if feral_attack_info and db:
+                upload_id = str(uuid.uuid4())
+                emit_event(db, sid, "feral.attack", {
+                    "band": feral_attack_info.get("band"),
+                    "action": feral_attack_info.get("action"),
+                    "effects": feral_attack_info.get("effects", {})
+                }, entity_id=upload_id, commit=False)
+
+            # Apply womb systems (decay, attacks) after state change
+            from game.wombs import check_and_apply_womb_systems
+            new_state, attack_message = check_and_apply_womb_systems(new_state)
+            
+            # Optional: Emit upload.complete event if DB available
+            soul_xp_delta = new_state.soul_xp - old_soul_xp
+            soul_percent_delta = new_state.soul_percent - old_soul_percent
+            
+            if db:
+                emit_event(db, sid, "upload.complete", {
+                    "clone_id": clone_id,
+                    "soul_xp_delta": soul_xp_delta,
+                    "soul_percent_delta": soul_percent_delta,
+                }, entity_id=clone_id, commit=False)
+        finally:
+            # One commit for this request's events, even if womb systems raised
+            commit_events(db)
 
         # Phase 6: Include feral attack info and level up message if occurred
         response_data = {
@@ -2232,7 +2254,7 @@ async def upload_clone_endpoint(
         elif attack_message:
             response_data["attack_message"] = attack_message
         
-        response = JSONResponse(content=response_data)
+        response = ORJSONResponse(content=response_data)
         set_session_cookie(response, sid, "session_id")
         return response
     except Exception as e:
@@ -2338,7 +2360,7 @@ async def repair_womb_endpoint(
         if attack_message:
             response_data["attack_message"] = attack_message
         
-        response = JSONResponse(content=response_data)
+        response = ORJSONResponse(content=response_data)
         set_session_cookie(response, sid, "session_id")
         return response
     except HTTPException:
@@ -2494,7 +2516,7 @@ async def pray_to_trinary_endpoint(
             logger.info(f"📤 Sending kill_clone effect to frontend: {effect_description['kill_clone']}")
         logger.debug(f"📤 Trinary prayer response - Effects: {list(effects)}, Effect description keys: {list(effect_description.keys())}")
         
-        response = JSONResponse(content=response_data)
+        response = ORJSONResponse(content=response_data)
         set_session_cookie(response, sid, "session_id")
         return response
     except HTTPException:
@@ -2583,7 +2605,7 @@ async def get_events_feed(
             
             # Parse payload
             try:
-                payload = json.loads(row['payload_json']) if row['payload_json'] else {}
+                payload = orjson.loads(row['payload_json']) if row['payload_json'] else {}
             except:
                 payload = {}
             
@@ -2626,7 +2648,7 @@ async def get_events_feed(
             )
             return response
         
-        response = JSONResponse(content=events)
+        response = ORJSONResponse(content=events)
         response.headers["ETag"] = etag_value
         # Always set session cookie to ensure persistence
         set_session_cookie(response, sid, "session_id")
@@ -2638,7 +2660,7 @@ async def get_events_feed(
         # Log full exception for debugging 404 issue
         import traceback
         logger.error(f"Events feed exception traceback: {traceback.format_exc()}")
-        response = JSONResponse(content=[])
+        response = ORJSONResponse(content=[])
         # Still set cookie even on error
         set_session_cookie(response, sid, "session_id")
         return response
@@ -2708,7 +2730,7 @@ async def get_limits_status(
         "reset_at": int(earliest_reset)
     }
     
-    response = JSONResponse(content={
+    response = ORJSONResponse(content={
         "window_seconds": window_seconds,
         "now": int(now),
         "endpoints": endpoint_status
@@ -2726,7 +2748,7 @@ async def get_server_time():
     Used by frontend progress bars and timers to sync with server clock.
     Returns current server timestamp in seconds since epoch.
     """
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "server_time": time.time(),
         "timestamp": int(time.time())
     })
@@ -2751,7 +2773,7 @@ async def get_upload_breakdown(
     # Get retain range for formula explanation
     retain_range = CONFIG["SOUL_XP_RETAIN_RANGE"]  # (0.6, 0.9)
 
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "formula_explanation": {
             "base_formula": "SELF XP Gain = Clone Total XP × Retention Multiplier",
             "retention_multiplier": f"Scales from {retain_range[0]} (level 0) to {retain_range[1]} (level 10+)",
@@ -1,7 +1,9 @@
 """Leaderboard API endpoints"""
 from fastapi import APIRouter, HTTPException, Depends, Request
-from typing import List
-from datetime import datetime
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from typing import List, Optional
+from datetime import datetime, timezone
 import time
 
 from models import LeaderboardEntry, LeaderboardSubmission
@@ -16,6 +18,40 @@ RATE_LIMIT_WINDOW = 60  # seconds
 RATE_LIMIT_MAX_REQUESTS = 10  # max requests per window
 
 
+# Constraint failures the submit endpoint reports as 400 (its documented contract);
+# malformed bodies (missing fields, wrong types) still get FastAPI's 422
+_SUBMIT_ERROR_MESSAGES = {
+    ("self_name", "string_too_short"): "self_name cannot be empty",
+    ("self_name", "string_too_long"): "self_name too long (max 100 characters)",
+}
+
+
+def _submission_error_message(error: dict) -> Optional[str]:
+    """Map a pydantic error on LeaderboardSubmission to its 400 message, if it has one"""
+    field = error["loc"][-1]
+    if error["type"] == "greater_than_equal":
+        return f"{field} must be non-negative"
+    return _SUBMIT_ERROR_MESSAGES.get((field, error["type"]))
+
+
+class _SubmissionRoute(APIRoute):
+    """Route class that turns LeaderboardSubmission constraint errors into a 400"""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request):
+            try:
+                return await handler(request)
+            except RequestValidationError as exc:
+                messages = [_submission_error_message(error) for error in exc.errors()]
+                if not messages or None in messages:
+                    raise
+                raise HTTPException(status_code=400, detail=messages[0])
+
+        return route_handler
+
+
 def get_client_ip(request: Request) -> str:
     """Extract client IP address"""
     # Check for forwarded IP (from proxy/load balancer)
@@ -96,7 +132,6 @@ async def get_leaderboard(
         return []
 
 
-@router.post("/submit")
 async def submit_to_leaderboard(
     submission: LeaderboardSubmission,
     request: Request
@@ -107,11 +142,6 @@ async def submit_to_leaderboard(
     Rate limited: 10 requests per minute per IP.
     Returns error if database is unavailable (leaderboard is optional feature).
     """
-    # Validate submission
-    is_valid, error_msg = submission.validate()
-    if not is_valid:
-        raise HTTPException(status_code=400, detail=error_msg)
-    
     # Rate limiting
     client_ip = get_client_ip(request)
     if not check_rate_limit(client_ip):
@@ -134,7 +164,7 @@ async def submit_to_leaderboard(
         cursor = execute_query(db, "SELECT * FROM leaderboard WHERE self_name = ?", (submission.self_name,))
         existing = cursor.fetchone()
         
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         
         if existing:
             # Update existing entry if new stats are better
@@ -190,6 +220,9 @@ async def submit_to_leaderboard(
         )
 
 
+router.add_api_route("/submit", submit_to_leaderboard, methods=["POST"], route_class_override=_SubmissionRoute)
+
+
 @router.get("/stats")
 async def get_leaderboard_stats():
     """Get leaderboard statistics (total entries, etc.)
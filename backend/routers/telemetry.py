@@ -1,8 +1,9 @@
 """Telemetry API endpoints"""
 from fastapi import APIRouter, HTTPException, Depends, Request
 from typing import List, Dict, Any
-import json
+import orjson
 import time
+from datetime import datetime
 
 from models import TelemetryEvent
 from database import get_db, DatabaseConnection, execute_query
@@ -86,13 +87,14 @@ async def upload_telemetry(
             if not event_type:
                 continue
             
+            # Use provided timestamp (parse if string)
+            if isinstance(timestamp, str) and timestamp:
+                timestamp = datetime.fromisoformat(timestamp)
+            else:
+                timestamp = None
+            
             # Create event
-            event = TelemetryEvent.create(session_id, event_type, data)
-            if timestamp:
-                # Use provided timestamp (parse if string)
-                if isinstance(timestamp, str):
-                    from datetime import datetime
-                    event.timestamp = datetime.fromisoformat(timestamp)
+            event = TelemetryEvent.create(session_id, event_type, data, timestamp)
             
             # Insert into database
             execute_query(db, """
@@ -102,7 +104,7 @@ async def upload_telemetry(
                 event.id,
                 event.session_id,
                 event.event_type,
-                json.dumps(event.data),
+                orjson.dumps(event.data).decode(),
                 event.timestamp.isoformat()
             ))
             inserted_count += 1
@@ -0,0 +1,55 @@
+"""Tests for the config API (ETag caching and precompressed responses)"""
+import pytest
+
+
+class TestGameplayConfigETag:
+    """Each body encoding has its own ETag, and 304s repeat the 200 headers"""
+
+    def test_identity_and_gzip_etags_differ(self, client):
+        """The gzip and identity bodies must not share a strong validator"""
+        identity = client.get("/api/config/gameplay", headers={"Accept-Encoding": "identity"})
+        gzipped = client.get("/api/config/gameplay", headers={"Accept-Encoding": "gzip"})
+
+        assert identity.status_code == 200
+        assert gzipped.status_code == 200
+        assert "Content-Encoding" not in identity.headers
+        assert gzipped.headers["Content-Encoding"] == "gzip"
+        assert identity.headers["ETag"] != gzipped.headers["ETag"]
+        assert identity.json() == gzipped.json()
+
+    @pytest.mark.parametrize("encoding", ["identity", "gzip"])
+    def test_not_modified_keeps_vary_and_cache_control(self, client, encoding):
+        """A 304 carries the same ETag, Vary and Cache-Control as the 200 it validates"""
+        first = client.get("/api/config/gameplay", headers={"Accept-Encoding": encoding})
+        etag = first.headers["ETag"]
+
+        response = client.get(
+            "/api/config/gameplay",
+            headers={"Accept-Encoding": encoding, "If-None-Match": etag},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.headers["Vary"] == first.headers["Vary"]
+        assert response.headers["Cache-Control"] == first.headers["Cache-Control"]
+
+    def test_either_etag_revalidates(self, client):
+        """A client that switches encodings still gets a 304 for an unchanged config"""
+        identity_etag = client.get(
+            "/api/config/gameplay", headers={"Accept-Encoding": "identity"}
+        ).headers["ETag"]
+
+        response = client.get(
+            "/api/config/gameplay",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": identity_etag},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] != identity_etag
+
+    def test_stale_etag_gets_full_body(self, client):
+        """An unknown ETag returns the full config"""
+        response = client.get("/api/config/gameplay", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert "version" in response.json()
@@ -40,6 +40,12 @@ class TestDatabaseConnection:
             result = cursor.fetchone()
             assert result[0] == 1
 
+    def test_sqlite_pragmas_applied(self, temp_db):
+        """Test that SQLite connections run in WAL mode with NORMAL sync"""
+        conn = temp_db.connect()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
 
 class TestDatabaseSchema:
     """Tests for database schema initialization"""
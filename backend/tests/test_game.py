@@ -1130,3 +1130,40 @@ class TestRateLimitMessageFormatting:
         assert len(msg) > 0
         assert "Keeper:" in msg
         assert "Try again in" in msg
+
+
+class TestBatchedEventEmission:
+    """Tests for emit_event(commit=False) batches flushed by commit_events()"""
+
+    @pytest.fixture
+    def events_db(self, db_connection):
+        """Connection with the (optional) events table created"""
+        db_connection.execute("""
+            CREATE TABLE IF NOT EXISTS events (
+                id TEXT PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                event_subtype TEXT,
+                entity_id TEXT,
+                payload_json TEXT,
+                privacy_level TEXT DEFAULT 'private',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        db_connection.commit()
+        return db_connection
+
+    def test_failed_insert_keeps_queued_events(self, events_db, monkeypatch):
+        """A failing batched INSERT must not roll back events queued earlier in the request"""
+        from routers import game as game_router
+
+        fixed_id = uuid.UUID("00000000-0000-4000-8000-000000000001")
+        monkeypatch.setattr(game_router.uuid, "uuid4", lambda: fixed_id)
+
+        game_router.emit_event(events_db, "session-1", "feral.attack", {"n": 1}, commit=False)
+        # Same id again: the INSERT fails on the primary key
+        game_router.emit_event(events_db, "session-1", "gather.start", {"n": 2}, commit=False)
+        game_router.commit_events(events_db)
+
+        rows = events_db.execute("SELECT event_type, event_subtype FROM events").fetchall()
+        assert [tuple(row) for row in rows] == [("feral", "attack")]
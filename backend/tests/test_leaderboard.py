@@ -143,6 +143,20 @@ class TestLeaderboardSubmit:
         response = client.post("/api/leaderboard/submit", json=entry)
         assert response.status_code == 400
 
+    def test_submit_constraint_error_message(self, client, sample_leaderboard_entry):
+        """Constraint failures keep the 400 detail message clients display"""
+        entry = sample_leaderboard_entry.copy()
+        entry["self_name"] = ""
+        response = client.post("/api/leaderboard/submit", json=entry)
+        assert response.json()["detail"] == "self_name cannot be empty"
+
+    def test_submit_wrong_type_still_422(self, client, sample_leaderboard_entry):
+        """Malformed bodies keep FastAPI's 422, as before"""
+        entry = sample_leaderboard_entry.copy()
+        entry["soul_level"] = "not-a-number"
+        response = client.post("/api/leaderboard/submit", json=entry)
+        assert response.status_code == 422
+
     def test_submit_rate_limiting(self, client, sample_leaderboard_entry):
         """Test rate limiting on submit endpoint"""
         # Make 11 requests rapidly (limit is 10 per minute)
@@ -0,0 +1,177 @@
+"""Tests for the outcome engine (backend/engine/outcomes.py)"""
+import json
+
+import orjson
+import pytest
+from backend.engine.outcomes import (
+    LazyTerms, OutcomeContext, SeedParts, _PCG32, compute_rng_seed,
+    resolve_expedition, resolve_gather, resolve_grow, resolve_upload,
+)
+from core.config import CONFIG, GAMEPLAY_CONFIG
+from core.models import Clone
+
+_YELLOW_THRESHOLD = GAMEPLAY_CONFIG.get("attention", {}).get("bands", {}).get("yellow", 25)
+
+
+def _grow_ctx(global_attention: float, n: int) -> OutcomeContext:
+    return OutcomeContext(
+        action="grow",
+        clone=None,
+        self_level=1,
+        practices={"Kinetic": 0, "Cognitive": 0, "Constructive": 0},
+        global_attention=global_attention,
+        womb_durability=100.0,
+        clone_kind="BASIC",
+        soul_percent=100.0,
+        config=CONFIG,
+        gameplay_config=GAMEPLAY_CONFIG,
+        seed_parts=SeedParts(
+            self_name="tester",
+            womb_id=1,
+            task_started_at=1700000000.0 + n,
+            config_version=GAMEPLAY_CONFIG.get("config_version", "test"),
+            action_id=f"grow-{n}",
+        ),
+    )
+
+
+def _feral_mods(outcome):
+    return [m for m in outcome.mods_applied if m.source.startswith("FeralAttack:")]
+
+
+class TestGrowFeralAttack:
+    """Regression tests: grow feral penalties only apply when an attack happens"""
+
+    @pytest.mark.parametrize("global_attention", [0.0, _YELLOW_THRESHOLD - 0.01])
+    def test_no_feral_mods_without_attention(self, global_attention):
+        """Below the yellow band there is no attack roll and no FeralAttack mods"""
+        outcome = resolve_grow(_grow_ctx(global_attention, 0))
+
+        assert outcome.feral_attack is None
+        assert _feral_mods(outcome) == []
+
+    def test_feral_mods_match_attacks_at_high_attention(self):
+        """At red attention, FeralAttack mods appear exactly when an attack is reported"""
+        attacks = 0
+        for n in range(200):
+            outcome = resolve_grow(_grow_ctx(100.0, n))
+            if outcome.feral_attack is None:
+                assert _feral_mods(outcome) == []
+            else:
+                attacks += 1
+                assert outcome.feral_attack["action"] == "grow"
+                assert _feral_mods(outcome), "Feral attack reported without penalty mods"
+
+        assert attacks > 0, "Expected at least one feral attack at red attention"
+
+
+class TestSeedParts:
+    """compute_rng_seed must accept whatever womb ids client state carries"""
+
+    @pytest.mark.parametrize("womb_id", ["womb-1", None, 1.5, 2**70])
+    def test_non_int64_womb_id_seeds(self, womb_id):
+        parts = SeedParts("tester", womb_id, 1700000000.0, "v1", "a")
+        assert compute_rng_seed(parts) == compute_rng_seed(parts)
+        assert compute_rng_seed(parts) != compute_rng_seed(parts._replace(womb_id=7))
+
+
+def _ctx(action: str, **overrides) -> OutcomeContext:
+    clone = Clone(
+        id="clone-1",
+        kind="BASIC",
+        traits={"PWC": 7, "DLT": 3, "ELK": 6},
+        xp={"MINING": 120, "COMBAT": 40, "EXPLORATION": 10},
+        survived_runs=2,
+        created_at=1700000000.0,
+    )
+    fields = dict(
+        action=action,
+        clone=clone,
+        self_level=3,
+        practices={"Kinetic": 10, "Cognitive": 10, "Constructive": 10},
+        global_attention=30.0,
+        womb_durability=80.0,
+        soul_percent=100.0,
+        clone_kind="BASIC",
+        config=CONFIG,
+        gameplay_config=GAMEPLAY_CONFIG,
+        seed_parts=SeedParts("tester", 1, 1700000000.0, "v1", f"{action}-1"),
+    )
+    fields.update(overrides)
+    return OutcomeContext(**fields)
+
+
+class TestOutcomeSerialization:
+    """Outcome.to_dict() must be JSON-encodable for every resolver (terms may be LazyTerms)"""
+
+    @pytest.mark.parametrize("resolve, ctx", [
+        (resolve_expedition, lambda: _ctx("expedition", expedition_kind="MINING")),
+        (resolve_gather, lambda: _ctx("gather", resource="Tritanium")),
+        (resolve_grow, lambda: _ctx("grow", clone=None)),
+        (resolve_upload, lambda: _ctx("upload")),
+    ], ids=["expedition", "gather", "grow", "upload"])
+    def test_to_dict_serializes(self, resolve, ctx):
+        outcome = resolve(ctx())
+        data = outcome.to_dict()
+
+        assert not isinstance(data["terms"], LazyTerms)
+        assert orjson.loads(orjson.dumps(data)) == json.loads(json.dumps(data))
+        assert json.loads(json.dumps(data))["terms"] == json.loads(json.dumps(dict(outcome.terms)))
+
+
+class TestPCG32:
+    """The per-resolve RNG: pinned output, randint bounds and error paths"""
+
+    SEED_PARTS = SeedParts("tester", 1, 1700000000.0, "v1", "expedition-1")
+
+    def test_fixed_seed_parts_give_stable_output(self):
+        """Changing the seed recipe or the generator changes every outcome; pin both"""
+        seed = compute_rng_seed(self.SEED_PARTS)
+        assert seed == 8967518635624388805
+
+        rng = _PCG32(seed)
+        assert [rng._next() for _ in range(3)] == [1325498727, 2643304361, 2620540125]
+
+        rng = _PCG32(seed)
+        assert [rng.randint(1, 6) for _ in range(8)] == [4, 6, 4, 4, 2, 3, 1, 4]
+
+    def test_same_seed_same_stream(self):
+        a, b = _PCG32(12345), _PCG32(12345)
+        assert [a.random() for _ in range(50)] == [b.random() for _ in range(50)]
+        assert [_PCG32(1).random() for _ in range(5)] != [_PCG32(2).random() for _ in range(5)]
+
+    @pytest.mark.parametrize("a, b", [(0, 0), (7, 7), (-3, -3)])
+    def test_randint_single_value_range(self, a, b):
+        rng = _PCG32(99)
+        assert {rng.randint(a, b) for _ in range(20)} == {a}
+
+    def test_randint_hits_both_endpoints_and_stays_in_range(self):
+        rng = _PCG32(2024)
+        draws = [rng.randint(1, 3) for _ in range(600)]
+        assert set(draws) == {1, 2, 3}
+        # Roughly uniform: each value near 200 of 600
+        assert all(150 < draws.count(v) < 250 for v in (1, 2, 3))
+
+    def test_randint_full_32_bit_range(self):
+        rng = _PCG32(7)
+        assert all(0 <= rng.randint(0, 2**32 - 1) <= 2**32 - 1 for _ in range(100))
+
+    @pytest.mark.parametrize("a, b", [(5, 4), (0, 2**32)])
+    def test_randint_unsupported_range_raises(self, a, b):
+        """Empty ranges (as random.randint) and ranges wider than 32 bits raise ValueError"""
+        with pytest.raises(ValueError):
+            _PCG32(1).randint(a, b)
+
+    def test_random_is_unit_interval_and_uniform(self):
+        rng = _PCG32(31337)
+        draws = [rng.random() for _ in range(10000)]
+        assert all(0.0 <= x < 1.0 for x in draws)
+        assert abs(sum(draws) / len(draws) - 0.5) < 0.02
+        buckets = [0] * 10
+        for x in draws:
+            buckets[int(x * 10)] += 1
+        assert all(900 < count < 1100 for count in buckets)
+
+    def test_uniform_bounds(self):
+        rng = _PCG32(5)
+        assert all(-0.2 <= rng.uniform(-0.2, 0.2) < 0.2 for _ in range(1000))
@@ -298,6 +298,112 @@ class TestRequestSizeLimits:
         assert response.status_code == 200
 
 
+    def test_chunked_body_over_limit_rejected(self, client, caplog):
+        """A chunked body (no Content-Length) is cut off with a 413 once it passes the limit"""
+        chunks = iter([b"x" * 4096] * 4)  # 16KB against the 10KB default
+
+        with caplog.at_level("ERROR"):
+            response = client.post(
+                "/api/leaderboard/submit",
+                content=chunks,
+                headers={"Content-Type": "application/json"},
+            )
+
+        assert response.status_code == 413
+        assert "Maximum size" in response.json()["detail"]
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert "Content-Security-Policy" in response.headers
+        # The app sees a disconnect, which must not surface as a 500
+        assert not [r for r in caplog.records if "Unhandled exception" in r.getMessage()]
+
+    def test_understated_content_length_rejected(self, client, caplog):
+        """A Content-Length under the limit does not let a larger body through"""
+        with caplog.at_level("ERROR"):
+            response = client.post(
+                "/api/leaderboard/submit",
+                content=b"x" * (20 * 1024),
+                headers={"Content-Type": "application/json", "Content-Length": "100"},
+            )
+
+        assert response.status_code == 413
+        assert response.headers["X-Frame-Options"] == "DENY"
+        assert not [r for r in caplog.records if "Unhandled exception" in r.getMessage()]
+
+    def test_mid_body_overrun_sends_single_response(self):
+        """After a mid-body 413 the app gets http.disconnect and its own response is dropped"""
+        import asyncio
+        from starlette.requests import ClientDisconnect, Request
+        from main import SecurityStackMiddleware
+
+        app_saw_disconnect = False
+
+        async def app(scope, receive, send):
+            nonlocal app_saw_disconnect
+            try:
+                await Request(scope, receive).body()
+            except ClientDisconnect:
+                app_saw_disconnect = True
+            await send({"type": "http.response.start", "status": 500, "headers": []})
+            await send({"type": "http.response.body", "body": b"late"})
+
+        chunks = [
+            {"type": "http.request", "body": b"x" * 8192, "more_body": True},
+            {"type": "http.request", "body": b"x" * 8192, "more_body": False},
+        ]
+
+        async def receive():
+            return chunks.pop(0)
+
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/api/leaderboard/submit",
+            "headers": [(b"content-type", b"application/json")],
+            "client": ("testclient", 50000),
+        }
+        asyncio.run(SecurityStackMiddleware(app)(scope, receive, send))
+
+        starts = [m for m in sent if m["type"] == "http.response.start"]
+        assert app_saw_disconnect
+        assert [m["status"] for m in starts] == [413]
+        assert (b"x-content-type-options", b"nosniff") in starts[0]["headers"]
+        assert b"late" not in [m.get("body") for m in sent]
+
+
+class TestCSRFMiddleware:
+    """Test CSRF rejections from the security middleware"""
+
+    def test_missing_csrf_token_rejected_with_403(self, client):
+        """A state-changing request with a session but no CSRF token gets a 403, not a 500"""
+        response = client.post(
+            "/api/leaderboard/submit",
+            json={"self_name": "Tester", "soul_level": 1, "soul_xp": 0},
+            cookies={"session_id": "test-session-123"},
+        )
+
+        assert response.status_code == 403
+        assert response.json()["detail"].startswith("CSRF validation failed")
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        assert "Content-Security-Policy" in response.headers
+
+    def test_size_limit_checked_before_csrf(self, client):
+        """An oversized request is rejected as 413 even when CSRF would also fail"""
+        response = client.post(
+            "/api/leaderboard/submit",
+            content=b"x" * (20 * 1024),
+            headers={"Content-Type": "application/json"},
+            cookies={"session_id": "test-session-123"},
+        )
+
+        assert response.status_code == 413
+        assert response.headers["X-Frame-Options"] == "DENY"
+
+
 class TestSessionSecurity:
     """Test session management security"""
 
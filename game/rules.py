@@ -376,7 +376,7 @@ def run_expedition(state: GameState, kind: str) -> Tuple[GameState, str, Optiona
     for res, amount in outcome.loot.items():
         new_state.resources[res] = new_state.resources.get(res, 0) + amount
     
-    for xp_kind, xp_amount in outcome.xp_gained.items():
+    for xp_kind, xp_amount in outcome.xp_gained:
         new_clone.xp[xp_kind] = new_clone.xp.get(xp_kind, 0) + xp_amount
     
     # Increment survived_runs
@@ -396,7 +396,7 @@ def run_expedition(state: GameState, kind: str) -> Tuple[GameState, str, Optiona
     
     # Format success message with flavor text
     from backend.routers.game import format_expedition_message
-    gained = outcome.xp_gained.get(kind, 0)
+    gained = next((amount for xp_kind, amount in outcome.xp_gained if xp_kind == kind), 0)
     msg = format_expedition_message(
         expedition_kind=kind,
         success=True,